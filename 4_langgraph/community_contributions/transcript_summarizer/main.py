@@ -1,12 +1,12 @@
 import os
 import gradio as gr
 from src.ui.gradio_app import create_gradio_interface
-from src.utils.config import Config
+from src.utils.config import get_config
 
 def main():
     """Main entry point for the transcript summarizer application."""
     # Load configuration
-    config = Config()
+    config = get_config()
     
     print("🚀 Starting Transcript Summarizer...")
     print(f"✨ LLM Provider: {config.llm_provider.capitalize()}")
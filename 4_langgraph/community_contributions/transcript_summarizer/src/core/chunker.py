@@ -1,7 +1,14 @@
 import tiktoken
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator
 from dataclasses import dataclass
 import math
+import re
+import bisect
+import itertools
+
+# Sentence splitting pattern and sentence-ending characters, built once at import
+_SENTENCE_RE = re.compile(r'[.!?]+\s+')
+_SENTENCE_END_CHARS = frozenset('.!?')
 
 @dataclass
 class TextChunk:
@@ -43,8 +50,44 @@ class TextChunker:
         Returns:
             List of TextChunk objects
         """
+        return list(self._iter_chunk_text(text, preserve_sentences))
+    
+    def chunk_by_sentences(self, text: str) -> List[TextChunk]:
+        """
+        Chunk text by sentences, respecting token limits.
+        
+        Args:
+            text: Input text to chunk
+            
+        Returns:
+            List of TextChunk objects
+        """
+        return list(self._iter_chunk_by_sentences(text))
+    
+    def iter_chunks(self, text: str, by_sentences: bool = True, preserve_sentences: bool = True) -> Iterator[TextChunk]:
+        """
+        Lazily chunk text, yielding one TextChunk at a time.
+        
+        Lets callers consume chunks as they are produced instead of holding
+        every chunk of a large transcript in memory at once.
+        
+        Args:
+            text: Input text to chunk
+            by_sentences: Use sentence-based chunking (as chunk_by_sentences)
+            preserve_sentences: Whether to try to preserve sentence boundaries
+                when chunking by tokens (ignored when by_sentences is True)
+            
+        Yields:
+            TextChunk objects
+        """
+        if by_sentences:
+            return self._iter_chunk_by_sentences(text)
+        return self._iter_chunk_text(text, preserve_sentences)
+    
+    def _iter_chunk_text(self, text: str, preserve_sentences: bool) -> Iterator[TextChunk]:
+        """Generator backing chunk_text."""
         if not text.strip():
-            return []
+            return
         
         # Tokenize the entire text
         tokens = self.tokenizer.encode(text)
@@ -52,15 +95,15 @@ class TextChunker:
         
         if total_tokens <= self.chunk_size:
             # Text fits in a single chunk
-            return [TextChunk(
+            yield TextChunk(
                 content=text,
                 start_index=0,
                 end_index=len(text),
                 token_count=total_tokens,
                 chunk_id=0
-            )]
+            )
+            return
         
-        chunks = []
         chunk_id = 0
         start_token = 0
         
@@ -87,7 +130,7 @@ class TextChunker:
                 token_count=len(chunk_tokens),
                 chunk_id=chunk_id
             )
-            chunks.append(chunk)
+            yield chunk
             
             # Calculate next start position with overlap
             start_token = max(end_token - self.overlap_size, start_token + 1)
@@ -96,75 +139,108 @@ class TextChunker:
             # Prevent infinite loop
             if start_token >= end_token:
                 break
-        
-        return chunks
     
-    def chunk_by_sentences(self, text: str) -> List[TextChunk]:
-        """
-        Chunk text by sentences, respecting token limits.
-        
-        Args:
-            text: Input text to chunk
-            
-        Returns:
-            List of TextChunk objects
-        """
-        import re
-        
+    def _iter_chunk_by_sentences(self, text: str) -> Iterator[TextChunk]:
+        """Generator backing chunk_by_sentences."""
         # Split into sentences using regex
-        sentence_endings = r'[.!?]+\s+'
-        sentences = re.split(sentence_endings, text)
+        sentences = [sentence.strip() for sentence in _SENTENCE_RE.split(text)]
+        sentences = [sentence for sentence in sentences if sentence]
+        if not sentences:
+            return
+        
+        # Encode every sentence once, in the form it takes when appended to a
+        # chunk (the joining space attaches to the sentence's first token).
+        # Prefix sums of these counts give the token count of any run of
+        # sentences, so chunk boundaries are found by binary search instead of
+        # re-encoding the growing chunk, and the overlap is cut from these
+        # tokens instead of re-encoding each finished chunk.
+        sentence_tokens = self._encode_batch([" " + sentence for sentence in sentences])
+        prefix = list(itertools.accumulate(map(len, sentence_tokens), initial=0))
         
-        chunks = []
-        current_chunk = ""
-        current_tokens = 0
+        # Accumulate sentences in a list and join once per chunk, instead of
+        # growing a string with += (which copies the whole chunk every time)
+        current_parts: List[str] = [sentences[0]]
+        current_char_len = len(sentences[0])
+        current_tokens = len(self.tokenizer.encode(sentences[0]))
         chunk_id = 0
         start_index = 0
+        next_sentence = 1
+        # First sentence of the chunk that was appended in its joined form
+        first_joined = 1
         
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if not sentence:
-                continue
+        while next_sentence < len(sentences):
+            # Last sentence index (exclusive) that still fits in this chunk
+            budget = self.chunk_size - current_tokens + prefix[next_sentence]
+            end = max(bisect.bisect_right(prefix, budget, lo=next_sentence, hi=len(prefix)) - 1, next_sentence)
             
-            sentence_tokens = len(self.tokenizer.encode(sentence))
+            for sentence in sentences[next_sentence:end]:
+                current_parts.append(sentence)
+                current_char_len += 1 + len(sentence)
+            current_tokens += prefix[end] - prefix[next_sentence]
             
-            # If adding this sentence would exceed the limit, create a new chunk
-            if current_tokens + sentence_tokens > self.chunk_size and current_chunk:
-                chunk = TextChunk(
-                    content=current_chunk.strip(),
-                    start_index=start_index,
-                    end_index=start_index + len(current_chunk),
-                    token_count=current_tokens,
-                    chunk_id=chunk_id
-                )
-                chunks.append(chunk)
-                
-                # Start new chunk with overlap
-                overlap_text = self._get_overlap_text(current_chunk)
-                current_chunk = overlap_text + " " + sentence
-                current_tokens = len(self.tokenizer.encode(current_chunk))
-                start_index += len(chunk.content) - len(overlap_text)
-                chunk_id += 1
-            else:
-                # Add sentence to current chunk
-                if current_chunk:
-                    current_chunk += " " + sentence
-                else:
-                    current_chunk = sentence
-                current_tokens = len(self.tokenizer.encode(current_chunk))
-        
-        # Add the last chunk
-        if current_chunk.strip():
+            if end == len(sentences):
+                break
+            
+            # Adding the next sentence would exceed the limit, create a new chunk
+            current_chunk = " ".join(current_parts)
             chunk = TextChunk(
                 content=current_chunk.strip(),
                 start_index=start_index,
-                end_index=start_index + len(current_chunk),
+                end_index=start_index + current_char_len,
                 token_count=current_tokens,
                 chunk_id=chunk_id
             )
-            chunks.append(chunk)
+            yield chunk
+            
+            # Start new chunk with overlap
+            sentence = sentences[end]
+            if 0 < self.overlap_size <= prefix[end] - prefix[first_joined]:
+                overlap_text = self._tail_text(sentence_tokens, end)
+            else:
+                # The overlap reaches into the chunk's leading text
+                overlap_text = self._get_overlap_text(current_chunk)
+            current_parts = [overlap_text, sentence]
+            current_char_len = len(overlap_text) + 1 + len(sentence)
+            current_tokens = len(self.tokenizer.encode(" ".join(current_parts)))
+            start_index += len(chunk.content) - len(overlap_text)
+            chunk_id += 1
+            next_sentence = first_joined = end + 1
+        
+        # Add the last chunk
+        current_chunk = " ".join(current_parts)
+        yield TextChunk(
+            content=current_chunk.strip(),
+            start_index=start_index,
+            end_index=start_index + current_char_len,
+            token_count=current_tokens,
+            chunk_id=chunk_id
+        )
+    
+    def _encode_batch(self, texts: List[str]) -> List[List[int]]:
+        """Encode many texts at once, using tiktoken's threaded batch encoder when available."""
+        encode_batch = getattr(self.tokenizer, "encode_batch", None)
+        if encode_batch is not None:
+            return encode_batch(texts)
+        return [self.tokenizer.encode(text) for text in texts]
+    
+    def _tail_text(self, sentence_tokens: List[List[int]], end: int) -> str:
+        """
+        Decode the last overlap_size tokens of the sentences before `end`.
         
-        return chunks
+        Args:
+            sentence_tokens: Tokens of each sentence in its joined form
+            end: Index of the first sentence after the overlap
+            
+        Returns:
+            Overlap text
+        """
+        start = end
+        count = 0
+        while count < self.overlap_size:
+            start -= 1
+            count += len(sentence_tokens[start])
+        tail = list(itertools.chain.from_iterable(sentence_tokens[start:end]))
+        return self.tokenizer.decode(tail[-self.overlap_size:])
     
     def _adjust_chunk_boundary(self, text: str) -> str:
         """
@@ -177,11 +253,8 @@ class TextChunker:
             Adjusted text
         """
         # Try to find the last sentence ending
-        import re
-        sentence_endings = ['.', '!', '?']
-        
         for i in range(len(text) - 1, -1, -1):
-            if text[i] in sentence_endings and i < len(text) - 1:
+            if text[i] in _SENTENCE_END_CHARS and i < len(text) - 1:
                 # Found a sentence ending, include it and any following whitespace
                 end_index = i + 1
                 while end_index < len(text) and text[end_index].isspace():
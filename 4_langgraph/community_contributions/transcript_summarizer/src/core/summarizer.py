@@ -1,37 +1,92 @@
 import asyncio
+import io
 import logging
-from typing import List, Dict, Any, Optional, TypedDict
+import re
+import threading
+from typing import List, Dict, Any, Optional, TypedDict, Tuple, Callable, AsyncIterator
 from dataclasses import dataclass
 import time
-from concurrent.futures import ThreadPoolExecutor
 
 from langchain_core.documents import Document
+from langchain_core.runnables import RunnableConfig
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langgraph.graph import StateGraph, START, END
 
 from ..core.vtt_parser import VTTParser, TranscriptSegment
 from ..core.chunker import TextChunker, TextChunk
 from ..services.ollama_service import OllamaService, OllamaResponse
-from ..services.gemini_service import GeminiService, GeminiResponse
-from ..utils.config import Config
+from ..services.gemini_service import GeminiService, GeminiResponse, ASYNC_MAX_OUTPUT_TOKENS
+from ..utils.config import Config, get_config
+from ..utils.llm_cache import SemanticCache
 
 # Set up logging for debugging using config
-config_instance = Config()
-log_level = getattr(logging, config_instance.log_level.upper(), logging.INFO)
-logging.basicConfig(level=log_level)
+config_instance = get_config()
+logging.basicConfig(level=config_instance.log_level_int)
 logger = logging.getLogger(__name__)
 
+# Ollama works through requests one at a time: one in flight plus the next one
+# queued behind it keeps it busy without piling up requests that sit waiting
+# until they time out
+OLLAMA_PIPELINE_DEPTH = 2
+
+# Row markers separating chunks (and their summaries) in a marshaled prompt
+_ROW_MARKER_RE = re.compile(r"^\s*---ROW (\d+)---\s*$", re.MULTILINE)
+
+@dataclass
+class ProcessingStats:
+    """Statistics collected while a transcript moves through the workflow."""
+    # perf_counter() timestamps; only their difference is meaningful
+    start_time: float = 0.0
+    end_time: float = 0.0
+    processing_time: float = 0.0
+    original_length: int = 0
+    original_words: int = 0
+    chunks_created: int = 0
+    chunking_strategy: str = ""
+    actual_chunk_size_used: int = 0
+    actual_overlap_used: int = 0
+    single_chunk: bool = False
+    chunks_summarized: int = 0
+    chunks_cached: int = 0
+    chunks_deduplicated: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    temperature_used: Optional[float] = None
+    final_temperature_used: Optional[float] = None
+    final_summary_length: int = 0
+    final_summary_words: int = 0
+    compression_ratio: float = 0.0
+
 class SummarizationState(TypedDict):
     """State for the summarization workflow."""
     original_text: str
     chunks: Optional[List[TextChunk]]
     chunk_summaries: Optional[List[str]]
     final_summary: str
-    processing_stats: Optional[Dict[str, Any]]
+    processing_stats: Optional[ProcessingStats]
     error: Optional[str]
     # Add configuration tracking
     debug_config: Optional[Dict[str, Any]]
 
+@dataclass
+class RunSettings:
+    """
+    Settings for one summarization run.
+    
+    Captured when the run starts and passed to the workflow nodes through the
+    run config, so concurrent runs with different overrides (or a provider
+    switch mid-run) never see each other's values.
+    """
+    temperature: float
+    chunk_size: int
+    chunk_overlap: int
+    marshal_batch_size: int
+    llm_provider: str
+    model_name: str
+    llm_service: Any
+    chunker: TextChunker
+    concurrency: int
+
 @dataclass
 class SummarizationResult:
     """Result of the summarization process."""
@@ -46,6 +101,53 @@ class SummarizationResult:
 class TranscriptSummarizer:
     """Main summarizer class using LangGraph for workflow orchestration."""
     
+    # Prompt text is built once here; the per-call methods only fill in the variable parts
+    _CHUNK_SUMMARY_TEMPLATE = """You are an expert at summarizing transcript content. Please provide a concise but comprehensive summary of the following transcript segment.
+
+This is chunk {chunk_num} of {total_chunks} from a larger transcript.
+
+Key requirements:
+- Capture the main topics and key points discussed
+- Preserve important details, names, and specific information
+- Keep the summary focused and well-structured
+- Maintain the chronological flow of information
+- Use clear, professional language
+
+Transcript segment:
+{chunk_text}
+
+Summary:"""
+
+    # Several chunks marshaled into one request; each summary comes back under its row marker
+    _MARSHALED_SUMMARY_TEMPLATE = """You are an expert at summarizing transcript content. Below are {row_count} consecutive segments of a larger transcript, chunks {first_chunk} to {last_chunk} of {total_chunks}. Each segment starts with a ---ROW n--- marker.
+
+Summarize each segment separately, with a concise but comprehensive summary that meets these requirements:
+- Capture the main topics and key points discussed
+- Preserve important details, names, and specific information
+- Keep the summary focused and well-structured
+- Maintain the chronological flow of information
+- Use clear, professional language
+
+Reply with exactly {row_count} summaries. Start each summary with the ---ROW n--- marker of its segment on a line of its own, and write nothing else.
+
+{rows}"""
+
+    _FINAL_SUMMARY_PREFIX = """You are an expert at creating comprehensive summaries from multiple related text segments. Below are summaries of different parts of a transcript. Please create a final, cohesive summary that:
+
+1. Integrates all the key information from the segments
+2. Maintains logical flow and structure
+3. Eliminates redundancy while preserving important details
+4. Provides a clear overview of the main topics and conclusions
+5. Uses professional, clear language
+6. Organizes information in a helpful way for the reader
+
+Segment summaries:
+"""
+
+    _FINAL_SUMMARY_SUFFIX = """
+
+Please provide a comprehensive final summary:"""
+    
     def __init__(self, config: Config):
         """
         Initialize the summarizer.
@@ -55,65 +157,180 @@ class TranscriptSummarizer:
         """
         self.config = config
         logger.info("🔧 INITIALIZATION DEBUG: TranscriptSummarizer initialized")
-        logger.info(f"📊 Initial Config - Temperature: {config.temperature}")
-        logger.info(f"📊 Initial Config - Chunk Size: {config.chunk_size}")
-        logger.info(f"📊 Initial Config - Chunk Overlap: {config.chunk_overlap}")
-        logger.info(f"📊 Initial Config - LLM Provider: {config.llm_provider}")
-        logger.info(f"📊 Initial Config - Ollama URL: {config.ollama_base_url}")
-        logger.info(f"📊 Initial Config - Ollama Model: {config.ollama_model_name}")
-        logger.info(f"📊 Initial Config - Gemini Model: {config.gemini_model_name}")
+        logger.info("📊 Initial Config - Temperature: %s", config.temperature)
+        logger.info("📊 Initial Config - Chunk Size: %s", config.chunk_size)
+        logger.info("📊 Initial Config - Chunk Overlap: %s", config.chunk_overlap)
+        logger.info("📊 Initial Config - LLM Provider: %s", config.llm_provider)
         
         self.llm_service = self._initialize_llm_service(config)
+        logger.info("📊 Initial Config - Model: %s", self._model_name)
         self.chunker = TextChunker(
             chunk_size=config.chunk_size,
             overlap_size=config.chunk_overlap
         )
         self.vtt_parser = VTTParser()
+        self.cache = SemanticCache(
+            config.cache_path,
+            similarity_threshold=config.semantic_cache_threshold,
+            ttl_seconds=config.cache_ttl_seconds,
+            max_entries=config.cache_max_entries
+        ) if config.cache_enabled else None
         self.workflow = self._create_workflow()
+        
+        if config.warm_up_llm:
+            # Non-blocking: the first chunk request would otherwise pay the
+            # connection setup and (for Ollama) model load time
+            threading.Thread(target=self._warm_up_llm_service, name="llm-warm-up", daemon=True).start()
+    
+    def _warm_up_llm_service(self) -> None:
+        """Prime the LLM service so the first summarization request starts fast."""
+        try:
+            if self.llm_service.warm_up():
+                logger.info("🔥 WARM-UP DEBUG: LLM service warmed up")
+        except Exception as e:
+            logger.warning("⚠️ WARM-UP DEBUG: LLM service warm-up failed - %s", e)
     
     def _initialize_llm_service(self, config: Config):
         """Initialize the appropriate LLM service based on configuration."""
         if config.llm_provider == "ollama":
-            logger.info(f"Initializing OllamaService with base_url={config.ollama_base_url}, model={config.ollama_model_name}")
+            logger.info("Initializing OllamaService with base_url=%s, model=%s", config.ollama_base_url, config.ollama_model_name)
+            self._model_name = config.ollama_model_name
             return OllamaService(
                 base_url=config.ollama_base_url,
                 model=config.ollama_model_name,
-                timeout=config.request_timeout
+                timeout=config.request_timeout,
+                concurrency=self._request_concurrency(config)
             )
         elif config.llm_provider == "gemini":
             if not config.gemini_api_key:
                 raise ValueError("GEMINI_API_KEY must be set in .env for Gemini provider.")
-            logger.info(f"Initializing GeminiService with model={config.gemini_model_name}")
+            logger.info("Initializing GeminiService with model=%s", config.gemini_model_name)
+            self._model_name = config.gemini_model_name
             return GeminiService(
                 api_key=config.gemini_api_key,
                 model=config.gemini_model_name,
-                timeout=config.request_timeout
+                timeout=config.request_timeout,
+                concurrency=config.max_concurrent_requests
             )
         else:
             raise ValueError(f"Unsupported LLM provider: {config.llm_provider}")
 
-    def update_config(self, chunk_size: int, chunk_overlap: int, temperature: float):
+    @staticmethod
+    def _request_concurrency(config: Config) -> int:
+        """Maximum LLM requests in flight: capped at OLLAMA_PIPELINE_DEPTH for Ollama."""
+        if config.llm_provider == "ollama":
+            return min(config.max_concurrent_requests, OLLAMA_PIPELINE_DEPTH)
+        return config.max_concurrent_requests
+
+    # Cache lookups hit SQLite (and the embedding model for semantic matches),
+    # so they run on a worker thread to keep the event loop free
+    async def _cache_get_many(self, prompts: List[str], settings: RunSettings) -> List[Optional[str]]:
+        """Look up cached LLM responses for prompts under the run's provider, model and temperature."""
+        if self.cache is None:
+            return [None] * len(prompts)
+        provider, model, temperature = settings.llm_provider, settings.model_name, settings.temperature
+        return await asyncio.to_thread(
+            lambda: [self.cache.get(prompt, provider, model, temperature) for prompt in prompts]
+        )
+
+    async def _cache_set_many(self, responses: Dict[str, str], settings: RunSettings) -> None:
+        """Store LLM responses by prompt under the run's provider, model and temperature."""
+        if self.cache is None or not responses:
+            return
+        provider, model, temperature = settings.llm_provider, settings.model_name, settings.temperature
+
+        def store() -> None:
+            for prompt, response in responses.items():
+                self.cache.set(prompt, response, provider, model, temperature)
+
+        await asyncio.to_thread(store)
+
+    async def _cache_get_by_keys(self, keys: List[str]) -> List[Optional[str]]:
+        """Look up values stored under caller-computed keys."""
+        if self.cache is None:
+            return [None] * len(keys)
+        return await asyncio.to_thread(lambda: [self.cache.get_by_key(key) for key in keys])
+
+    async def _cache_set_by_keys(self, values: Dict[str, str], scope: str) -> None:
+        """Store values under caller-computed keys."""
+        if self.cache is None or not values:
+            return
+
+        def store() -> None:
+            for key, value in values.items():
+                self.cache.set_by_key(key, value, scope=scope)
+
+        await asyncio.to_thread(store)
+
+    @staticmethod
+    def _chunk_cache_key(chunk: TextChunk, settings: RunSettings) -> str:
+        """Key a chunk summary on the chunk content, provider, model and temperature (independent of chunk position)."""
+        return SemanticCache.make_key(chunk.content, settings.llm_provider, settings.model_name, settings.temperature)
+    
+    def _run_settings(self, chunk_size: Optional[int], chunk_overlap: Optional[int], temperature: Optional[float], marshal_batch_size: Optional[int]) -> RunSettings:
         """
-        Update configuration and recreate necessary components.
+        Capture the settings for one run, falling back to the configuration for any override not given.
+        
+        The shared chunker is reused when size and overlap match; otherwise the
+        run gets its own.
+        """
+        chunk_size = chunk_size if chunk_size is not None else self.config.chunk_size
+        chunk_overlap = chunk_overlap if chunk_overlap is not None else self.config.chunk_overlap
+        chunker = self.chunker
+        if chunk_size != chunker.chunk_size or chunk_overlap != chunker.overlap_size:
+            chunker = TextChunker(chunk_size=chunk_size, overlap_size=chunk_overlap)
+        return RunSettings(
+            temperature=temperature if temperature is not None else self.config.temperature,
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            marshal_batch_size=marshal_batch_size if marshal_batch_size is not None else self.config.marshal_batch_size,
+            llm_provider=self.config.llm_provider,
+            model_name=self._model_name,
+            llm_service=self.llm_service,
+            chunker=chunker,
+            concurrency=self._request_concurrency(self.config)
+        )
+    
+    @staticmethod
+    def _settings(config: RunnableConfig) -> RunSettings:
+        """Get the run's settings from the config passed to a workflow node."""
+        return config["configurable"]["settings"]
+
+    def update_config(self, chunk_size: int, chunk_overlap: int, temperature: float, marshal_batch_size: Optional[int] = None):
+        """
+        Update the default configuration and recreate necessary components.
+        
+        Runs already in progress keep the settings they started with. Only values that differ from the current configuration are applied, and
+        the chunker is only rebuilt when chunk size or overlap changes.
         
         Args:
             chunk_size: New chunk size
             chunk_overlap: New chunk overlap
             temperature: New temperature
+            marshal_batch_size: New number of chunks per Gemini request (optional)
         """
-        logger.info("🔄 CONFIG UPDATE DEBUG: Updating configuration")
-        logger.info(f"📊 OLD Config - Temperature: {self.config.temperature}")
-        logger.info(f"📊 OLD Config - Chunk Size: {self.config.chunk_size}")
-        logger.info(f"📊 OLD Config - Chunk Overlap: {self.config.chunk_overlap}")
+        if temperature != self.config.temperature:
+            logger.info("🔄 CONFIG UPDATE DEBUG: Temperature %s -> %s", self.config.temperature, temperature)
+            self.config.temperature = temperature
+        
+        if marshal_batch_size is not None and marshal_batch_size != self.config.marshal_batch_size:
+            logger.info("🔄 CONFIG UPDATE DEBUG: Marshal batch size %s -> %s", self.config.marshal_batch_size, marshal_batch_size)
+            self.config.marshal_batch_size = marshal_batch_size
+        
+        if chunk_size == self.config.chunk_size and chunk_overlap == self.config.chunk_overlap:
+            # The chunker only depends on size and overlap, keep the existing one
+            return
+        
+        logger.info("🔄 CONFIG UPDATE DEBUG: Updating chunking configuration")
+        logger.info("📊 OLD Config - Chunk Size: %s", self.config.chunk_size)
+        logger.info("📊 OLD Config - Chunk Overlap: %s", self.config.chunk_overlap)
         
         # Update config
-        self.config.temperature = temperature
         self.config.chunk_size = chunk_size
         self.config.chunk_overlap = chunk_overlap
         
-        logger.info(f"📊 NEW Config - Temperature: {self.config.temperature}")
-        logger.info(f"📊 NEW Config - Chunk Size: {self.config.chunk_size}")
-        logger.info(f"📊 NEW Config - Chunk Overlap: {self.config.chunk_overlap}")
+        logger.info("📊 NEW Config - Chunk Size: %s", self.config.chunk_size)
+        logger.info("📊 NEW Config - Chunk Overlap: %s", self.config.chunk_overlap)
         
         # Recreate chunker with new settings
         self.chunker = TextChunker(
@@ -127,169 +344,216 @@ class TranscriptSummarizer:
     def _create_workflow(self):
         """Create the LangGraph workflow for summarization."""
         
-        def parse_input(state: SummarizationState) -> SummarizationState:
+        def parse_input(state: SummarizationState, config: RunnableConfig) -> Dict[str, Any]:
             """Parse and validate input."""
             logger.info("🏁 WORKFLOW DEBUG: Starting parse_input node")
             if not state.get("original_text", "").strip():
                 logger.error("❌ WORKFLOW DEBUG: Empty input text")
-                return {**state, "error": "Empty input text"}
+                return {"error": "Empty input text"}
             
             # Initialize processing stats
-            processing_stats = {
-                "start_time": time.time(),
-                "original_length": len(state["original_text"]),
-                "original_words": len(state["original_text"].split())
-            }
+            processing_stats = ProcessingStats(
+                start_time=time.perf_counter(),
+                original_length=len(state["original_text"]),
+                original_words=len(state["original_text"].split())
+            )
             
             # Add debug config to state
+            settings = self._settings(config)
             debug_config = {
-                "temperature": self.config.temperature,
-                "chunk_size": self.config.chunk_size,
-                "chunk_overlap": self.config.chunk_overlap,
-                "llm_provider": self.config.llm_provider,
-                "model_name": self.config.ollama_model_name if self.config.llm_provider == "ollama" else self.config.gemini_model_name
+                "temperature": settings.temperature,
+                "chunk_size": settings.chunk_size,
+                "chunk_overlap": settings.chunk_overlap,
+                "llm_provider": settings.llm_provider,
+                "model_name": settings.model_name
             }
             
-            logger.info(f"🐛 WORKFLOW DEBUG: Configuration in parse_input - {debug_config}")
+            logger.info("🐛 WORKFLOW DEBUG: Configuration in parse_input - %s", debug_config)
             
-            return {**state, "processing_stats": processing_stats, "debug_config": debug_config}
+            return {"processing_stats": processing_stats, "debug_config": debug_config}
         
-        def chunk_text(state: SummarizationState) -> SummarizationState:
+        def chunk_text(state: SummarizationState, config: RunnableConfig) -> Dict[str, Any]:
             """Chunk the text for processing."""
             logger.info("✂️ WORKFLOW DEBUG: Starting chunk_text node")
             debug_config = state.get("debug_config", {})
-            logger.info(f"🐛 WORKFLOW DEBUG: Using chunk_size={debug_config.get('chunk_size')} and chunk_overlap={debug_config.get('chunk_overlap')}")
+            logger.info("🐛 WORKFLOW DEBUG: Using chunk_size=%s and chunk_overlap=%s", debug_config.get('chunk_size'), debug_config.get('chunk_overlap'))
             
             if state.get("error"):
-                return state
+                return {}
             
             try:
+                chunker = self._settings(config).chunker
                 # Log current chunker configuration
-                logger.info(f"🔧 CHUNKER DEBUG: Chunker configured with size={self.chunker.chunk_size}, overlap={self.chunker.overlap_size}")
+                logger.info("🔧 CHUNKER DEBUG: Chunker configured with size=%s, overlap=%s", chunker.chunk_size, chunker.overlap_size)
                 
-                chunks = self.chunker.chunk_by_sentences(state["original_text"])
-                logger.info(f"📊 CHUNKER DEBUG: Created {len(chunks)} chunks")
+                chunks = chunker.chunk_by_sentences(state["original_text"])
+                logger.info("📊 CHUNKER DEBUG: Created %d chunks", len(chunks))
                 
-                # Log chunk details
-                for i, chunk in enumerate(chunks):
-                    logger.info(f"📄 CHUNK {i+1} DEBUG: {chunk.token_count} tokens, first 100 chars: {chunk.content[:100]}...")
+                # Log chunk details (per-chunk, so only when DEBUG is enabled)
+                if logger.isEnabledFor(logging.DEBUG):
+                    for i, chunk in enumerate(chunks):
+                        logger.debug("📄 CHUNK %d DEBUG: %d tokens, first 100 chars: %.100s...", i + 1, chunk.token_count, chunk.content)
                 
-                processing_stats = state.get("processing_stats", {})
-                processing_stats.update({
-                    "chunks_created": len(chunks),
-                    "chunking_strategy": "sentence-based",
-                    "actual_chunk_size_used": self.chunker.chunk_size,
-                    "actual_overlap_used": self.chunker.overlap_size
-                })
+                processing_stats = state["processing_stats"]
+                processing_stats.chunks_created = len(chunks)
+                processing_stats.chunking_strategy = "sentence-based"
+                processing_stats.actual_chunk_size_used = chunker.chunk_size
+                processing_stats.actual_overlap_used = chunker.overlap_size
                 
                 # If only one chunk, we might not need chunk-level summarization
                 if len(chunks) == 1:
-                    processing_stats["single_chunk"] = True
+                    processing_stats.single_chunk = True
                     logger.info("📝 CHUNKER DEBUG: Single chunk detected, will skip chunk summarization")
                 
-                return {**state, "chunks": chunks, "processing_stats": processing_stats}
+                return {"chunks": chunks, "processing_stats": processing_stats}
                 
             except Exception as e:
-                logger.error(f"❌ CHUNKER DEBUG: Error in chunking - {str(e)}")
-                return {**state, "error": f"Error chunking text: {str(e)}"}
+                logger.error("❌ CHUNKER DEBUG: Error in chunking - %s", e)
+                return {"error": f"Error chunking text: {str(e)}"}
         
-        async def summarize_chunks(state: SummarizationState) -> SummarizationState:
+        async def summarize_chunks(state: SummarizationState, config: RunnableConfig) -> Dict[str, Any]:
             """Summarize individual chunks."""
             logger.info("📝 WORKFLOW DEBUG: Starting summarize_chunks node")
             debug_config = state.get("debug_config", {})
-            logger.info(f"🐛 WORKFLOW DEBUG: Using temperature={debug_config.get('temperature')} for chunk summarization")
+            logger.info("🐛 WORKFLOW DEBUG: Using temperature=%s for chunk summarization", debug_config.get('temperature'))
             
             if state.get("error") or not state.get("chunks"):
-                return state
+                return {}
             
             try:
+                settings = self._settings(config)
                 chunks = state["chunks"]
                 
-                # If only one chunk, skip chunk summarization
+                # If only one chunk, its summary is the final summary: one LLM call
+                # and the create_final_summary pass is skipped
                 if len(chunks) == 1:
-                    logger.info("📝 CHUNK SUMMARY DEBUG: Single chunk, using original content")
-                    return {**state, "chunk_summaries": [chunks[0].content]}
+                    logger.info("📝 CHUNK SUMMARY DEBUG: Single chunk, summarizing it directly as the final summary")
+                    prompt = self._create_chunk_summary_prompt(chunks[0].content, 1, 1)
+                    summaries, cache_hits = await self._process_chunks_async([prompt], settings)
+                    final_summary = summaries[0]
+                    
+                    processing_stats = state["processing_stats"]
+                    processing_stats.chunks_summarized = 1
+                    processing_stats.temperature_used = settings.temperature
+                    processing_stats.cache_hits += cache_hits
+                    processing_stats.cache_misses += 1 - cache_hits
+                    self._record_final_stats(processing_stats, state["original_text"], final_summary, settings)
+                    
+                    return {"chunk_summaries": [final_summary], "final_summary": final_summary, "processing_stats": processing_stats}
                 
-                # Create prompts for each chunk
-                chunk_prompts = []
-                for i, chunk in enumerate(chunks):
-                    prompt = self._create_chunk_summary_prompt(chunk.content, i + 1, len(chunks))
-                    chunk_prompts.append(prompt)
-                    logger.info(f"📄 PROMPT DEBUG: Created prompt for chunk {i+1}, prompt length: {len(prompt)} chars")
+                # Reuse summaries of chunks seen in earlier runs, keyed on chunk content
+                chunk_keys = [self._chunk_cache_key(chunk, settings) for chunk in chunks]
+                chunk_summaries: List[Optional[str]] = await self._cache_get_by_keys(chunk_keys)
+                pending = [i for i, summary in enumerate(chunk_summaries) if summary is None]
+                chunks_cached = len(chunks) - len(pending)
+                logger.info("💾 CACHE DEBUG: %d of %d chunk summaries reused from earlier runs", chunks_cached, len(chunks))
                 
-                # Log temperature being used
-                logger.info(f"🌡️ TEMPERATURE DEBUG: About to call LLM service with temperature={self.config.temperature}")
+                # Repeated chunks (intros, sponsor reads) are summarized once, at
+                # their first position, and the summary is shared with the rest
+                first_pending: Dict[str, int] = {}
+                for i in pending:
+                    first_pending.setdefault(chunk_keys[i], i)
+                unique_pending = list(first_pending.values())
+                chunks_deduplicated = len(pending) - len(unique_pending)
+                if chunks_deduplicated:
+                    logger.info("♻️ DEDUP DEBUG: %d repeated chunks share a summary", chunks_deduplicated)
                 
-                # Process chunks asynchronously
-                chunk_summaries = await self._process_chunks_async(chunk_prompts)
+                cache_hits = 0
+                prompts_sent = 0
+                if unique_pending:
+                    # Log temperature being used
+                    logger.info("🌡️ TEMPERATURE DEBUG: About to call LLM service with temperature=%s", settings.temperature)
+                    
+                    # Process chunks asynchronously
+                    summaries, cache_hits, prompts_sent = await self._summarize_pending_chunks(chunks, unique_pending, settings)
+                    summary_by_key = {chunk_keys[i]: summary for i, summary in zip(unique_pending, summaries)}
+                    await self._cache_set_by_keys(summary_by_key, scope="chunk_summary")
+                    for i in pending:
+                        chunk_summaries[i] = summary_by_key[chunk_keys[i]]
                 
-                # Log results
-                for i, summary in enumerate(chunk_summaries):
-                    logger.info(f"📄 SUMMARY {i+1} DEBUG: {len(summary)} chars, first 100 chars: {summary[:100]}...")
+                # Log results (per-chunk, so only when DEBUG is enabled)
+                if logger.isEnabledFor(logging.DEBUG):
+                    for i, summary in enumerate(chunk_summaries):
+                        logger.debug("📄 SUMMARY %d DEBUG: %d chars, first 100 chars: %.100s...", i + 1, len(summary), summary)
                 
-                processing_stats = state.get("processing_stats", {})
-                processing_stats["chunks_summarized"] = len(chunk_summaries)
-                processing_stats["temperature_used"] = self.config.temperature
+                processing_stats = state["processing_stats"]
+                processing_stats.chunks_summarized = len(chunk_summaries)
+                processing_stats.temperature_used = settings.temperature
+                processing_stats.chunks_cached = chunks_cached
+                processing_stats.chunks_deduplicated = chunks_deduplicated
+                processing_stats.cache_hits += cache_hits
+                processing_stats.cache_misses += prompts_sent - cache_hits
                 
-                return {**state, "chunk_summaries": chunk_summaries, "processing_stats": processing_stats}
+                return {"chunk_summaries": chunk_summaries, "processing_stats": processing_stats}
                 
             except Exception as e:
-                logger.error(f"❌ CHUNK SUMMARY DEBUG: Error in chunk summarization - {str(e)}")
-                return {**state, "error": f"Error summarizing chunks: {str(e)}"}
+                logger.error("❌ CHUNK SUMMARY DEBUG: Error in chunk summarization - %s", e)
+                return {"error": f"Error summarizing chunks: {str(e)}"}
         
-        def create_final_summary(state: SummarizationState) -> SummarizationState:
-            """Create the final summary from chunk summaries."""
+        async def create_final_summary(state: SummarizationState, config: RunnableConfig) -> Dict[str, Any]:
+            """Create the final summary from chunk summaries, streaming it to an on_token callback if one was given."""
             logger.info("🎯 WORKFLOW DEBUG: Starting create_final_summary node")
             debug_config = state.get("debug_config", {})
-            logger.info(f"🐛 WORKFLOW DEBUG: Using temperature={debug_config.get('temperature')} for final summary")
+            logger.info("🐛 WORKFLOW DEBUG: Using temperature=%s for final summary", debug_config.get('temperature'))
             
             if state.get("error") or not state.get("chunk_summaries"):
-                return state
+                return {}
             
             try:
-                # Combine chunk summaries
-                combined_summaries = "\n\n".join(state["chunk_summaries"])
-                logger.info(f"📄 FINAL SUMMARY DEBUG: Combined summaries length: {len(combined_summaries)} chars")
-                
-                # Create final summary prompt
-                final_prompt = self._create_final_summary_prompt(combined_summaries)
-                logger.info(f"📄 FINAL PROMPT DEBUG: Final prompt length: {len(final_prompt)} chars")
+                settings = self._settings(config)
+                llm_service = settings.llm_service
+                # Create final summary prompt from the chunk summaries
+                final_prompt, prompt_length = self._create_final_summary_prompt(state["chunk_summaries"])
+                logger.info("📄 FINAL PROMPT DEBUG: Final prompt length: %d chars", prompt_length)
                 
                 # Log temperature being used
-                logger.info(f"🌡️ FINAL TEMPERATURE DEBUG: About to call LLM service with temperature={self.config.temperature}")
+                logger.info("🌡️ FINAL TEMPERATURE DEBUG: About to call LLM service with temperature=%s", settings.temperature)
                 
-                # Generate final summary
-                response = self.llm_service.generate_sync(
-                    prompt=final_prompt,
-                    temperature=self.config.temperature,
-                )
-                
-                final_summary = response.content.strip()
-                logger.info(f"📄 FINAL RESULT DEBUG: Final summary length: {len(final_summary)} chars")
-                logger.info(f"📄 FINAL RESULT DEBUG: First 200 chars: {final_summary}...")
+                # Generate final summary, reusing a cached one for a repeated prompt
+                final_summary = (await self._cache_get_many([final_prompt], settings))[0]
+                final_summary_cached = final_summary is not None
+                on_token = config.get("configurable", {}).get("on_token")
+                if final_summary_cached:
+                    logger.info("💾 CACHE DEBUG: Final summary served from cache")
+                    if on_token is not None:
+                        on_token(final_summary)
+                elif on_token is not None:
+                    # Stream so the caller can show the summary as it is written
+                    parts: List[str] = []
+                    async with llm_service:
+                        async for piece in llm_service.generate_stream_async(final_prompt, temperature=settings.temperature):
+                            parts.append(piece)
+                            on_token(piece)
+                    final_summary = "".join(parts).strip()
+                    await self._cache_set_many({final_prompt: final_summary}, settings)
+                else:
+                    # Runs the blocking HTTP call on a worker thread so the
+                    # event loop stays free while the LLM responds
+                    async with llm_service:
+                        response = await llm_service.generate_sync_in_executor(
+                            prompt=final_prompt,
+                            temperature=settings.temperature,
+                        )
+                    final_summary = response.content.strip()
+                    await self._cache_set_many({final_prompt: final_summary}, settings)
+                logger.info("📄 FINAL RESULT DEBUG: Final summary length: %d chars", len(final_summary))
+                logger.info("📄 FINAL RESULT DEBUG: First 200 chars: %.200s...", final_summary)
                 
                 # Update processing stats
-                processing_stats = state.get("processing_stats", {})
-                end_time = time.time()
-                processing_time = end_time - processing_stats.get("start_time", 0)
-                
-                processing_stats.update({
-                    "end_time": end_time,
-                    "processing_time": processing_time,
-                    "final_summary_length": len(final_summary),
-                    "final_summary_words": len(final_summary.split()),
-                    "compression_ratio": len(state["original_text"]) / len(final_summary) if final_summary else 0,
-                    "final_temperature_used": self.config.temperature
-                })
+                processing_stats = state["processing_stats"]
+                processing_stats.cache_hits += int(final_summary_cached)
+                processing_stats.cache_misses += int(not final_summary_cached)
+                self._record_final_stats(processing_stats, state["original_text"], final_summary, settings)
                 
-                logger.info(f"⏱️ TIMING DEBUG: Total processing time: {processing_time:.2f} seconds")
-                logger.info(f"📊 COMPRESSION DEBUG: Compression ratio: {processing_stats['compression_ratio']:.2f}x")
-                
-                return {**state, "final_summary": final_summary, "processing_stats": processing_stats}
+                return {"final_summary": final_summary, "processing_stats": processing_stats}
                 
             except Exception as e:
-                logger.error(f"❌ FINAL SUMMARY DEBUG: Error in final summary creation - {str(e)}")
-                return {**state, "error": f"Error creating final summary: {str(e)}"}
+                logger.error("❌ FINAL SUMMARY DEBUG: Error in final summary creation - %s", e)
+                return {"error": f"Error creating final summary: {str(e)}"}
+        
+        def route_after_chunks(state: SummarizationState) -> str:
+            """Skip the final-summary pass when summarize_chunks already produced it."""
+            return END if state.get("final_summary") else "create_final_summary"
         
         # Create the workflow graph
         workflow = StateGraph(SummarizationState)
@@ -304,61 +568,202 @@ class TranscriptSummarizer:
         workflow.add_edge(START, "parse_input")
         workflow.add_edge("parse_input", "chunk_text")
         workflow.add_edge("chunk_text", "summarize_chunks")
-        workflow.add_edge("summarize_chunks", "create_final_summary")
+        workflow.add_conditional_edges(
+            "summarize_chunks",
+            route_after_chunks,
+            {"create_final_summary": "create_final_summary", END: END}
+        )
         workflow.add_edge("create_final_summary", END)
         
         return workflow.compile()
     
-    async def _process_chunks_async(self, prompts: List[str]) -> List[str]:
-        """Process multiple chunk prompts asynchronously."""
-        logger.info(f"🔄 ASYNC DEBUG: Processing {len(prompts)} chunks asynchronously")
-        logger.info(f"🌡️ ASYNC TEMPERATURE DEBUG: Using temperature={self.config.temperature}")
-        
-        async with self.llm_service:
-            responses = await self.llm_service.generate_multiple_async(
-                prompts, 
-                temperature=self.config.temperature
-            )
-            
-            results = [response.content.strip() for response in responses]
-            logger.info(f"✅ ASYNC DEBUG: Completed processing {len(results)} chunks")
-            return results
-    
-    def _create_chunk_summary_prompt(self, chunk_text: str, chunk_num: int, total_chunks: int) -> str:
-        """Create a prompt for summarizing a text chunk."""
-        return f"""You are an expert at summarizing transcript content. Please provide a concise but comprehensive summary of the following transcript segment.
+    @staticmethod
+    def _marshal_batch_size(settings: RunSettings) -> int:
+        """Chunks per request: Gemini takes marshaled batches, Ollama queues requests serially so gets one chunk each."""
+        if settings.llm_provider != "gemini":
+            return 1
+        return settings.marshal_batch_size
 
-This is chunk {chunk_num} of {total_chunks} from a larger transcript.
-
-Key requirements:
-- Capture the main topics and key points discussed
-- Preserve important details, names, and specific information
-- Keep the summary focused and well-structured
-- Maintain the chronological flow of information
-- Use clear, professional language
-
-Transcript segment:
-{chunk_text}
+    async def _summarize_pending_chunks(self, chunks: List[TextChunk], indices: List[int], settings: RunSettings) -> Tuple[List[str], int, int]:
+        """
+        Summarize the chunks at the given positions, several per request when marshaling is enabled.
+        
+        A marshaled response that doesn't split back into one summary per
+        chunk is discarded, and those chunks are summarized one per request.
+        
+        Args:
+            chunks: All chunks of the transcript
+            indices: Positions of the chunks to summarize
+            settings: Settings of the current run
+            
+        Returns:
+            Tuple of (summaries in the order of indices, number of cache hits, number of prompts sent)
+        """
+        batch_size = self._marshal_batch_size(settings)
+        batches = [indices[start:start + batch_size] for start in range(0, len(indices), batch_size)]
+        prompts = [self._create_batch_prompt(chunks, batch) for batch in batches]
+        if logger.isEnabledFor(logging.DEBUG):
+            for batch, prompt in zip(batches, prompts):
+                logger.debug("📄 PROMPT DEBUG: Created prompt for chunks %s, prompt length: %d chars", [i + 1 for i in batch], len(prompt))
+        if batch_size > 1:
+            logger.info("📦 MARSHAL DEBUG: %d chunks marshaled into %d requests", len(indices), len(prompts))
+        
+        # A marshaled answer carries one summary per row (and, on thinking models,
+        # the thinking tokens as well), so it gets one chunk's output budget per row
+        output_tokens = {prompt: ASYNC_MAX_OUTPUT_TOKENS * len(batch) for batch, prompt in zip(batches, prompts) if len(batch) > 1}
+        responses, cache_hits = await self._process_chunks_async(prompts, settings, output_tokens)
+        
+        summary_by_index: Dict[int, str] = {}
+        unsplit: List[int] = []
+        for batch, response in zip(batches, responses):
+            rows = self._split_marshaled_response(response, len(batch)) if len(batch) > 1 else [response]
+            if rows is None:
+                logger.warning("⚠️ MARSHAL DEBUG: Response for chunks %d-%d has no usable row markers, summarizing them one by one", batch[0] + 1, batch[-1] + 1)
+                unsplit.extend(batch)
+                continue
+            summary_by_index.update(zip(batch, rows))
+        
+        prompts_sent = len(prompts)
+        if unsplit:
+            single_prompts = [self._create_chunk_summary_prompt(chunks[i].content, i + 1, len(chunks)) for i in unsplit]
+            summaries, single_hits = await self._process_chunks_async(single_prompts, settings)
+            summary_by_index.update(zip(unsplit, summaries))
+            cache_hits += single_hits
+            prompts_sent += len(single_prompts)
+        
+        return [summary_by_index[i] for i in indices], cache_hits, prompts_sent
 
-Summary:"""
+    def _create_batch_prompt(self, chunks: List[TextChunk], batch: List[int]) -> str:
+        """Create the prompt for one batch of chunk positions (a plain chunk prompt for a batch of one)."""
+        if len(batch) == 1:
+            return self._create_chunk_summary_prompt(chunks[batch[0]].content, batch[0] + 1, len(chunks))
+        rows = "\n\n".join(f"---ROW {row}---\n{chunks[i].content}" for row, i in enumerate(batch, 1))
+        return self._MARSHALED_SUMMARY_TEMPLATE.format(
+            row_count=len(batch),
+            first_chunk=batch[0] + 1,
+            last_chunk=batch[-1] + 1,
+            total_chunks=len(chunks),
+            rows=rows
+        )
 
-    def _create_final_summary_prompt(self, combined_summaries: str) -> str:
-        """Create a prompt for the final summary."""
-        return f"""You are an expert at creating comprehensive summaries from multiple related text segments. Below are summaries of different parts of a transcript. Please create a final, cohesive summary that:
+    @staticmethod
+    def _split_marshaled_response(response: str, row_count: int) -> Optional[List[str]]:
+        """
+        Split a marshaled response into one summary per row.
+        
+        Returns:
+            Summaries in row order, or None unless rows 1..row_count each have a non-empty summary
+        """
+        # re.split with a capture group alternates [preamble, row, text, row, text, ...]
+        parts = _ROW_MARKER_RE.split(response)
+        rows: Dict[int, str] = {}
+        for row, text in zip(parts[1::2], parts[2::2]):
+            rows.setdefault(int(row), text.strip())
+        summaries = [rows.get(row, "") for row in range(1, row_count + 1)]
+        if len(rows) != row_count or not all(summaries):
+            return None
+        return summaries
 
-1. Integrates all the key information from the segments
-2. Maintains logical flow and structure
-3. Eliminates redundancy while preserving important details
-4. Provides a clear overview of the main topics and conclusions
-5. Uses professional, clear language
-6. Organizes information in a helpful way for the reader
+    async def _process_chunks_async(self, prompts: List[str], settings: RunSettings, output_tokens: Optional[Dict[str, int]] = None) -> Tuple[List[str], int]:
+        """
+        Process multiple chunk prompts asynchronously.
+        
+        Cached responses are reused, and only cache misses are sent to the LLM,
+        each distinct prompt once.
+        
+        Args:
+            prompts: Prompts to send
+            settings: Settings of the current run
+            output_tokens: Output token limit per prompt, for marshaled prompts (optional)
+        
+        Returns:
+            Tuple of (chunk summaries in prompt order, number of cache hits)
+        """
+        logger.info("🔄 ASYNC DEBUG: Processing %d chunks asynchronously", len(prompts))
+        logger.info("🌡️ ASYNC TEMPERATURE DEBUG: Using temperature=%s", settings.temperature)
+        
+        results: List[Optional[str]] = await self._cache_get_many(prompts, settings)
+        misses = [i for i, result in enumerate(results) if result is None]
+        cache_hits = len(prompts) - len(misses)
+        logger.info("💾 CACHE DEBUG: %d of %d chunk summaries served from cache", cache_hits, len(prompts))
+        
+        if misses:
+            # Identical prompts get a single request whose response fills every position
+            positions: Dict[str, List[int]] = {}
+            for i in misses:
+                positions.setdefault(prompts[i], []).append(i)
+            if len(positions) < len(misses):
+                logger.info("♻️ DEDUP DEBUG: %d duplicate prompts skipped", len(misses) - len(positions))
+            
+            # Fan out explicitly, bounded by the provider's request limit, rather
+            # than relying on the service's own batching semantics
+            concurrency = settings.concurrency
+            llm_service = settings.llm_service
+            semaphore = asyncio.Semaphore(concurrency)
+            logger.debug("🔄 ASYNC DEBUG: %d requests, at most %d in flight", len(positions), concurrency)
+            
+            async def summarize_one(prompt: str) -> str:
+                # Only Gemini gets marshaled prompts, so only Gemini is passed a limit
+                limit = {"max_output_tokens": output_tokens[prompt]} if output_tokens and prompt in output_tokens else {}
+                async with semaphore:
+                    response = await llm_service.generate_async(
+                        prompt,
+                        temperature=settings.temperature,
+                        **limit
+                    )
+                return response.content.strip()
+            
+            async with llm_service:
+                summaries = await asyncio.gather(*(summarize_one(prompt) for prompt in positions))
+            
+            for indices, summary in zip(positions.values(), summaries):
+                for i in indices:
+                    results[i] = summary
+            await self._cache_set_many(dict(zip(positions, summaries)), settings)
+        
+        logger.info("✅ ASYNC DEBUG: Completed processing %d chunks", len(results))
+        return results, cache_hits
+    
+    def _record_final_stats(self, processing_stats: ProcessingStats, original_text: str, final_summary: str, settings: RunSettings) -> None:
+        """Record timing and final-summary statistics once the final summary is known."""
+        processing_stats.end_time = time.perf_counter()
+        processing_stats.processing_time = processing_stats.end_time - processing_stats.start_time
+        processing_stats.final_summary_length = len(final_summary)
+        processing_stats.final_summary_words = len(final_summary.split())
+        processing_stats.compression_ratio = len(original_text) / len(final_summary) if final_summary else 0
+        processing_stats.final_temperature_used = settings.temperature
+        
+        logger.info("⏱️ TIMING DEBUG: Total processing time: %.2f seconds", processing_stats.processing_time)
+        logger.info("📊 COMPRESSION DEBUG: Compression ratio: %.2fx", processing_stats.compression_ratio)
 
-Segment summaries:
-{combined_summaries}
+    def _create_chunk_summary_prompt(self, chunk_text: str, chunk_num: int, total_chunks: int) -> str:
+        """Create a prompt for summarizing a text chunk."""
+        return self._CHUNK_SUMMARY_TEMPLATE.format(
+            chunk_num=chunk_num,
+            total_chunks=total_chunks,
+            chunk_text=chunk_text
+        )
 
-Please provide a comprehensive final summary:"""
+    def _create_final_summary_prompt(self, chunk_summaries: List[str]) -> Tuple[str, int]:
+        """
+        Create a prompt for the final summary.
+        
+        The summaries are written straight into one buffer instead of being
+        joined first and then copied again into the prompt.
+        
+        Returns:
+            Tuple of (prompt, prompt length in characters)
+        """
+        buf = io.StringIO()
+        buf.write(self._FINAL_SUMMARY_PREFIX)
+        for i, summary in enumerate(chunk_summaries):
+            if i:
+                buf.write("\n\n")
+            buf.write(summary)
+        buf.write(self._FINAL_SUMMARY_SUFFIX)
+        return buf.getvalue(), buf.tell()
 
-    async def summarize_vtt_file(self, file_path: str, chunk_size: Optional[int] = None, chunk_overlap: Optional[int] = None, temperature: Optional[float] = None) -> SummarizationResult:
+    async def summarize_vtt_file(self, file_path: str, chunk_size: Optional[int] = None, chunk_overlap: Optional[int] = None, temperature: Optional[float] = None, marshal_batch_size: Optional[int] = None, on_token: Optional[Callable[[str], None]] = None) -> SummarizationResult:
         """
         Summarize a VTT file.
         
@@ -367,21 +772,23 @@ Please provide a comprehensive final summary:"""
             chunk_size: Override chunk size (optional)
             chunk_overlap: Override chunk overlap (optional)
             temperature: Override temperature (optional)
+            marshal_batch_size: Override chunks per Gemini request (optional)
+            on_token: Called with each piece of the final summary as it is generated (optional)
             
         Returns:
             SummarizationResult object
         """
         try:
-            logger.info(f"📂 VTT FILE DEBUG: Processing file {file_path}")
+            logger.info("📂 VTT FILE DEBUG: Processing file %s", file_path)
             # Parse VTT file
             segments = self.vtt_parser.parse_file(file_path)
             full_text = self.vtt_parser.get_full_transcript()
-            logger.info(f"📄 VTT FILE DEBUG: Extracted {len(segments)} segments, {len(full_text)} chars total")
+            logger.info("📄 VTT FILE DEBUG: Extracted %d segments, %d chars total", len(segments), len(full_text))
             
-            return await self.summarize_text(full_text, chunk_size, chunk_overlap, temperature)
+            return await self.summarize_text(full_text, chunk_size, chunk_overlap, temperature, marshal_batch_size, on_token)
             
         except Exception as e:
-            logger.error(f"❌ VTT FILE DEBUG: Error processing VTT file - {str(e)}")
+            logger.error("❌ VTT FILE DEBUG: Error processing VTT file - %s", e)
             return SummarizationResult(
                 summary="",
                 original_length=0,
@@ -392,7 +799,54 @@ Please provide a comprehensive final summary:"""
                 error=str(e)
             )
     
-    async def summarize_vtt_content(self, vtt_content: str, chunk_size: Optional[int] = None, chunk_overlap: Optional[int] = None, temperature: Optional[float] = None) -> SummarizationResult:
+    async def summarize_vtt_file_stream(self, file_path: str, chunk_size: Optional[int] = None, chunk_overlap: Optional[int] = None, temperature: Optional[float] = None, marshal_batch_size: Optional[int] = None) -> AsyncIterator[Tuple[str, Optional[SummarizationResult]]]:
+        """
+        Summarize a VTT file, yielding the final summary while it is generated.
+        
+        Chunk summaries are produced as usual; only the final pass streams. A
+        single-chunk transcript arrives in one piece.
+        
+        Args:
+            file_path: Path to the VTT file
+            chunk_size: Override chunk size (optional)
+            chunk_overlap: Override chunk overlap (optional)
+            temperature: Override temperature (optional)
+            marshal_batch_size: Override chunks per Gemini request (optional)
+            
+        Yields:
+            (summary so far, None) while streaming, then (final summary, SummarizationResult) once done
+        """
+        pieces: asyncio.Queue = asyncio.Queue()
+        task = asyncio.ensure_future(self.summarize_vtt_file(
+            file_path, chunk_size, chunk_overlap, temperature, marshal_batch_size, on_token=pieces.put_nowait
+        ))
+        # None marks the end of the stream
+        task.add_done_callback(lambda _: pieces.put_nowait(None))
+        
+        parts: List[str] = []
+        try:
+            while True:
+                piece = await pieces.get()
+                if piece is None:
+                    break
+                parts.append(piece)
+                # Take everything that arrived meanwhile, so a slow consumer
+                # gets fewer, larger updates
+                while not pieces.empty():
+                    piece = pieces.get_nowait()
+                    if piece is None:
+                        break
+                    parts.append(piece)
+                yield "".join(parts), None
+                if piece is None:
+                    break
+            result = await task
+            yield result.summary, result
+        finally:
+            # The caller may stop iterating early
+            task.cancel()
+    
+    async def summarize_vtt_content(self, vtt_content: str, chunk_size: Optional[int] = None, chunk_overlap: Optional[int] = None, temperature: Optional[float] = None, marshal_batch_size: Optional[int] = None, on_token: Optional[Callable[[str], None]] = None) -> SummarizationResult:
         """
         Summarize VTT content from a string.
         
@@ -401,21 +855,23 @@ Please provide a comprehensive final summary:"""
             chunk_size: Override chunk size (optional)
             chunk_overlap: Override chunk overlap (optional)
             temperature: Override temperature (optional)
+            marshal_batch_size: Override chunks per Gemini request (optional)
+            on_token: Called with each piece of the final summary as it is generated (optional)
             
         Returns:
             SummarizationResult object
         """
         try:
-            logger.info(f"📄 VTT CONTENT DEBUG: Processing VTT content, {len(vtt_content)} chars")
+            logger.info("📄 VTT CONTENT DEBUG: Processing VTT content, %d chars", len(vtt_content))
             # Parse VTT content
             segments = self.vtt_parser.parse_content(vtt_content)
             full_text = self.vtt_parser.get_full_transcript()
-            logger.info(f"📄 VTT CONTENT DEBUG: Extracted {len(segments)} segments, {len(full_text)} chars total")
+            logger.info("📄 VTT CONTENT DEBUG: Extracted %d segments, %d chars total", len(segments), len(full_text))
             
-            return await self.summarize_text(full_text, chunk_size, chunk_overlap, temperature)
+            return await self.summarize_text(full_text, chunk_size, chunk_overlap, temperature, marshal_batch_size, on_token)
             
         except Exception as e:
-            logger.error(f"❌ VTT CONTENT DEBUG: Error processing VTT content - {str(e)}")
+            logger.error("❌ VTT CONTENT DEBUG: Error processing VTT content - %s", e)
             return SummarizationResult(
                 summary="",
                 original_length=0,
@@ -426,7 +882,7 @@ Please provide a comprehensive final summary:"""
                 error=str(e)
             )
     
-    async def summarize_text(self, text: str, chunk_size: Optional[int] = None, chunk_overlap: Optional[int] = None, temperature: Optional[float] = None) -> SummarizationResult:
+    async def summarize_text(self, text: str, chunk_size: Optional[int] = None, chunk_overlap: Optional[int] = None, temperature: Optional[float] = None, marshal_batch_size: Optional[int] = None, on_token: Optional[Callable[[str], None]] = None) -> SummarizationResult:
         """
         Summarize plain text.
         
@@ -435,22 +891,19 @@ Please provide a comprehensive final summary:"""
             chunk_size: Override chunk size (optional)
             chunk_overlap: Override chunk overlap (optional)
             temperature: Override temperature (optional)
+            marshal_batch_size: Override chunks per Gemini request (optional)
+            on_token: Called with each piece of the final summary as it is generated (optional)
             
         Returns:
             SummarizationResult object
         """
         logger.info("🚀 SUMMARIZE DEBUG: Starting text summarization")
         
-        # Update configuration if provided
-        if chunk_size is not None or chunk_overlap is not None or temperature is not None:
-            new_chunk_size = chunk_size if chunk_size is not None else self.config.chunk_size
-            new_chunk_overlap = chunk_overlap if chunk_overlap is not None else self.config.chunk_overlap
-            new_temperature = temperature if temperature is not None else self.config.temperature
-            
-            logger.info("🔄 SUMMARIZE DEBUG: Updating configuration with provided values")
-            self.update_config(new_chunk_size, new_chunk_overlap, new_temperature)
+        # Overrides apply to this run only; the shared configuration is left
+        # alone so runs in progress side by side keep their own settings
+        settings = self._run_settings(chunk_size, chunk_overlap, temperature, marshal_batch_size)
         
-        logger.info(f"📊 SUMMARIZE DEBUG: Final config - Temperature: {self.config.temperature}, Chunk Size: {self.config.chunk_size}, Overlap: {self.config.chunk_overlap}")
+        logger.info("📊 SUMMARIZE DEBUG: Final config - Temperature: %s, Chunk Size: %s, Overlap: %s", settings.temperature, settings.chunk_size, settings.chunk_overlap)
         
         # Create initial state
         initial_state: SummarizationState = {
@@ -465,12 +918,13 @@ Please provide a comprehensive final summary:"""
         
         # Run the workflow
         logger.info("🎬 SUMMARIZE DEBUG: Starting LangGraph workflow")
-        result_state = await self.workflow.ainvoke(initial_state)
+        run_config: RunnableConfig = {"configurable": {"settings": settings, "on_token": on_token}}
+        result_state = await self.workflow.ainvoke(initial_state, config=run_config)
         logger.info("🏁 SUMMARIZE DEBUG: LangGraph workflow completed")
         
         # Create result object
         if result_state.get("error"):
-            logger.error(f"❌ SUMMARIZE DEBUG: Error in workflow - {result_state['error']}")
+            logger.error("❌ SUMMARIZE DEBUG: Error in workflow - %s", result_state['error'])
             return SummarizationResult(
                 summary="",
                 original_length=len(text),
@@ -481,25 +935,28 @@ Please provide a comprehensive final summary:"""
                 error=result_state["error"]
             )
         
-        stats = result_state.get("processing_stats", {})
+        stats = result_state.get("processing_stats") or ProcessingStats()
         result = SummarizationResult(
             summary=result_state.get("final_summary", ""),
-            original_length=stats.get("original_length", 0),
-            summary_length=stats.get("final_summary_length", 0),
-            chunks_processed=stats.get("chunks_summarized", 0),
-            processing_time=stats.get("processing_time", 0.0),
-            compression_ratio=stats.get("compression_ratio", 0.0)
+            original_length=stats.original_length,
+            summary_length=stats.final_summary_length,
+            chunks_processed=stats.chunks_summarized,
+            processing_time=stats.processing_time,
+            compression_ratio=stats.compression_ratio
         )
         
-        logger.info(f"✅ SUMMARIZE DEBUG: Summarization completed successfully")
-        logger.info(f"📊 RESULT DEBUG: Original: {result.original_length} chars, Summary: {result.summary_length} chars, Ratio: {result.compression_ratio:.2f}x")
+        logger.info("✅ SUMMARIZE DEBUG: Summarization completed successfully")
+        logger.info("📊 RESULT DEBUG: Original: %d chars, Summary: %d chars, Ratio: %.2fx", result.original_length, result.summary_length, result.compression_ratio)
         
         return result
     
-    def check_service_health(self) -> Dict[str, Any]:
+    async def check_service_health(self) -> Dict[str, Any]:
         """
         Check the health of the current LLM service and model availability.
         
+        The connection/model-list probe and the model info request are
+        independent, so they run concurrently on worker threads.
+        
         Returns:
             Health check results
         """
@@ -511,16 +968,21 @@ Please provide a comprehensive final summary:"""
             "timestamp": time.time()
         }
         
+        def probe_model() -> Tuple[bool, bool]:
+            # Both checks read the same cached model list, so running them in
+            # sequence makes one request where running them in parallel would make two
+            connection_ok = self.llm_service.test_connection()
+            return connection_ok, connection_ok and self.llm_service.check_model_availability()
+        
         try:
-            # Test connection
-            health_status["connection_ok"] = self.llm_service.test_connection()
-            
-            if health_status["connection_ok"]:
-                # Check model availability
-                health_status["model_available"] = self.llm_service.check_model_availability()
-                
-                # Get model info
-                health_status["model_info"] = self.llm_service.get_model_info()
+            (connection_ok, model_available), model_info = await asyncio.gather(
+                asyncio.to_thread(probe_model),
+                asyncio.to_thread(self.llm_service.get_model_info)
+            )
+            health_status["connection_ok"] = connection_ok
+            health_status["model_available"] = model_available
+            if connection_ok:
+                health_status["model_info"] = model_info
         
         except Exception as e:
             health_status["error"] = str(e)
@@ -1,20 +1,47 @@
 import webvtt
 from typing import List, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import io
 import re
 
+# Compiled once at import; _TAG_RE never spans the NUL separator used for bulk cleaning.
+# Whitespace is normalized with str.split()/join, which splits on the same
+# characters as \s+ but runs in C without the regex engine.
+_TAG_RE = re.compile(r'<[^>\x00]+>')
+_BULK_SEP = '\x00'
+
+def _timestamp_to_seconds(timestamp: str) -> float:
+    """Convert a VTT timestamp (HH:MM:SS.mmm or MM:SS.mmm) to seconds."""
+    seconds = 0.0
+    for part in timestamp.split(':'):
+        seconds = seconds * 60 + float(part)
+    return seconds
+
 @dataclass
 class TranscriptSegment:
     """Represents a segment of transcript with timing information."""
     start_time: str
     end_time: str
     text: str
+    # Start/end in seconds, parsed once from the timestamps at construction
+    start_s: float = field(init=False)
+    end_s: float = field(init=False)
+    
+    def __post_init__(self):
+        try:
+            self.start_s = _timestamp_to_seconds(self.start_time)
+            self.end_s = _timestamp_to_seconds(self.end_time)
+        except ValueError:
+            self.start_s = self.end_s = 0.0
     
 class VTTParser:
     """Parser for WebVTT transcript files."""
     
     def __init__(self):
         self.segments: List[TranscriptSegment] = []
+        # Joined transcripts, built on first request and reset on every parse
+        self._full_transcript: Optional[str] = None
+        self._timestamped_transcript: Optional[str] = None
     
     def parse_file(self, file_path: str) -> List[TranscriptSegment]:
         """
@@ -27,22 +54,9 @@ class VTTParser:
             List of TranscriptSegment objects
         """
         try:
+            # webvtt reads the file line by line and handles a UTF-8 BOM itself
             vtt = webvtt.read(file_path)
-            segments = []
-            
-            for caption in vtt:
-                # Clean the text by removing HTML tags and extra whitespace
-                clean_text = self._clean_text(caption.text)
-                if clean_text.strip():  # Only add non-empty segments
-                    segment = TranscriptSegment(
-                        start_time=caption.start,
-                        end_time=caption.end,
-                        text=clean_text
-                    )
-                    segments.append(segment)
-            
-            self.segments = segments
-            return segments
+            return self._segments_from_vtt(vtt)
             
         except Exception as e:
             raise ValueError(f"Error parsing VTT file: {str(e)}")
@@ -62,23 +76,42 @@ class VTTParser:
             return []
             
         try:
-            # Write content to a temporary file and parse it
-            import tempfile
-            import os
-            
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.vtt', delete=False) as tmp_file:
-                tmp_file.write(vtt_content)
-                tmp_file_path = tmp_file.name
-            
-            try:
-                segments = self.parse_file(tmp_file_path)
-                return segments
-            finally:
-                os.unlink(tmp_file_path)
+            # Parse directly from memory rather than round-tripping through a temp file
+            vtt = webvtt.from_buffer(io.StringIO(vtt_content))
+            return self._segments_from_vtt(vtt)
                 
         except Exception as e:
             raise ValueError(f"Error parsing VTT content: {str(e)}")
     
+    def _segments_from_vtt(self, vtt) -> List[TranscriptSegment]:
+        """
+        Build transcript segments from parsed WebVTT captions.
+        
+        Args:
+            vtt: Parsed webvtt.WebVTT object
+            
+        Returns:
+            List of TranscriptSegment objects
+        """
+        segments = []
+        
+        # Clean all caption texts in one pass by removing HTML tags and extra whitespace
+        cleaned_texts = self._clean_texts([caption.text for caption in vtt])
+        
+        for caption, clean_text in zip(vtt, cleaned_texts):
+            if clean_text:  # Only add non-empty segments
+                segment = TranscriptSegment(
+                    start_time=caption.start,
+                    end_time=caption.end,
+                    text=clean_text
+                )
+                segments.append(segment)
+        
+        self.segments = segments
+        self._full_transcript = None
+        self._timestamped_transcript = None
+        return segments
+    
     def get_full_transcript(self) -> str:
         """
         Get the full transcript text without timing information.
@@ -86,7 +119,9 @@ class VTTParser:
         Returns:
             Complete transcript as a single string
         """
-        return " ".join([segment.text for segment in self.segments])
+        if self._full_transcript is None:
+            self._full_transcript = " ".join(segment.text for segment in self.segments)
+        return self._full_transcript
     
     def get_transcript_with_timestamps(self) -> str:
         """
@@ -95,12 +130,12 @@ class VTTParser:
         Returns:
             Transcript with timing information
         """
-        formatted_segments = []
-        for segment in self.segments:
-            formatted_segments.append(
+        if self._timestamped_transcript is None:
+            self._timestamped_transcript = "\n".join(
                 f"[{segment.start_time} -> {segment.end_time}] {segment.text}"
+                for segment in self.segments
             )
-        return "\n".join(formatted_segments)
+        return self._timestamped_transcript
     
     def _clean_text(self, text: str) -> str:
         """
@@ -113,15 +148,29 @@ class VTTParser:
             Cleaned text
         """
         # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
+        text = _TAG_RE.sub('', text)
         
-        # Replace multiple whitespace with single space
-        text = re.sub(r'\s+', ' ', text)
+        # Collapse whitespace runs to single spaces and trim the ends
+        return ' '.join(text.split())
+    
+    def _clean_texts(self, texts: List[str]) -> List[str]:
+        """
+        Clean many caption texts at once.
         
-        # Remove leading/trailing whitespace
-        text = text.strip()
+        Joins the texts with a separator and strips tags with one regex pass over
+        the whole transcript, instead of a regex call per caption.
         
-        return text
+        Args:
+            texts: Raw caption texts from VTT
+            
+        Returns:
+            Cleaned texts, in the same order
+        """
+        if not texts:
+            return []
+        
+        combined = _TAG_RE.sub('', _BULK_SEP.join(texts))
+        return [' '.join(text.split()) for text in combined.split(_BULK_SEP)]
     
     def get_duration_seconds(self) -> float:
         """
@@ -133,22 +182,4 @@ class VTTParser:
         if not self.segments:
             return 0.0
         
-        def time_to_seconds(time_str: str) -> float:
-            """Convert VTT time format to seconds."""
-            # Handle format: HH:MM:SS.mmm or MM:SS.mmm
-            parts = time_str.split(':')
-            if len(parts) == 3:  # HH:MM:SS.mmm
-                hours, minutes, seconds = parts
-                return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
-            elif len(parts) == 2:  # MM:SS.mmm
-                minutes, seconds = parts
-                return int(minutes) * 60 + float(seconds)
-            else:
-                return float(parts[0])
-        
-        try:
-            start_time = time_to_seconds(self.segments[0].start_time)
-            end_time = time_to_seconds(self.segments[-1].end_time)
-            return end_time - start_time
-        except Exception:
-            return 0.0
+        return self.segments[-1].end_s - self.segments[0].start_s
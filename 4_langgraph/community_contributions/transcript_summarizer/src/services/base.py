@@ -0,0 +1,150 @@
+import asyncio
+import logging
+from typing import Any, AsyncIterator, List, Optional, Tuple, Union
+
+import aiohttp
+
+# Logging is configured by the application entry point
+logger = logging.getLogger(__name__)
+
+class LLMServiceBase:
+    """
+    Session lifecycle and batching shared by the LLM services.
+
+    Subclasses call _init_session_state() from __init__, set `timeout` and
+    `concurrency`, and implement generate_sync and generate_async. Override
+    _new_session to configure the aiohttp session and close() to release
+    resources held for the synchronous calls.
+    """
+
+    def _init_session_state(self) -> None:
+        """Set up the async session bookkeeping; no session is opened until first entry."""
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._active_contexts = 0  # open `async with` blocks using the session
+        self._close_requested = False
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the semaphore bounding concurrent generation requests."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._semaphore
+
+    def _new_session(self) -> aiohttp.ClientSession:
+        """Create the aiohttp session for the running event loop."""
+        return aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout))
+
+    async def __aenter__(self):
+        """
+        Async context manager entry.
+
+        The session and semaphore are created on first entry and kept for later
+        entries on the same event loop, so keep-alive connections survive
+        between the chunk and final-summary passes and across requests. Use
+        aclose() to release them.
+        """
+        loop = asyncio.get_running_loop()
+        self._active_contexts += 1
+        if self.session is not None and not self.session.closed and self._session_loop is loop:
+            return self
+        # A session left open on an earlier event loop would otherwise leak its sockets
+        await self._close_session()
+        self.session = self._new_session()
+        self._session_loop = loop
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit; the session stays open for the next entry unless aclose() is pending."""
+        self._active_contexts -= 1
+        if self._close_requested and self._active_contexts == 0:
+            await self._close_now()
+
+    async def aclose(self) -> None:
+        """
+        Close the async session and the resources used by the synchronous calls.
+
+        If requests are still running inside the async context manager, the
+        close is deferred until the last of them exits.
+        """
+        if self._active_contexts > 0:
+            logger.debug("Deferring close until %d active request(s) finish", self._active_contexts)
+            self._close_requested = True
+            return
+        await self._close_now()
+
+    async def _close_now(self) -> None:
+        """Release the async session and the resources used by the synchronous calls."""
+        self._close_requested = False
+        await self._close_session()
+        self.close()
+
+    def close(self) -> None:
+        """Release resources used by the synchronous calls (none by default)."""
+
+    async def _close_session(self) -> None:
+        """Close the aiohttp session, if any, and forget it."""
+        session, self.session = self.session, None
+        self._session_loop = None
+        if session is None or session.closed:
+            return
+        try:
+            await session.close()
+        except Exception as e:
+            # The loop the session was opened on may already be closed
+            logger.debug("Failed to close previous aiohttp session: %s", e)
+
+    @staticmethod
+    def _in_event_loop() -> bool:
+        """Check whether the calling thread is running an asyncio event loop."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return True
+
+    async def generate_sync_in_executor(self, prompt: str, temperature: float = 0.3, system_prompt: Optional[str] = None) -> Any:
+        """
+        Run generate_sync on a worker thread without blocking the event loop.
+
+        Args:
+            prompt: Input prompt
+            temperature: Temperature for generation
+            system_prompt: Optional system prompt
+
+        Returns:
+            The service's response object
+        """
+        return await asyncio.to_thread(self.generate_sync, prompt, temperature, system_prompt)
+
+    async def generate_as_completed_async(self, prompts: List[str], temperature: float = 0.3, system_prompt: Optional[str] = None) -> AsyncIterator[Tuple[int, Union[Any, Exception]]]:
+        """
+        Generate text for multiple prompts, yielding each result as soon as it finishes.
+
+        Unlike generate_multiple_async, callers can process or persist results
+        while the rest of the batch is still running. At most `concurrency`
+        requests are in flight.
+
+        Args:
+            prompts: List of input prompts
+            temperature: Temperature for generation
+            system_prompt: Optional system prompt
+
+        Yields:
+            (prompt index, response or the exception raised for that prompt), in completion order
+        """
+        async def generate_indexed(index: int, prompt: str):
+            try:
+                return index, await self.generate_async(prompt, temperature, system_prompt)
+            except Exception as e:
+                return index, e
+
+        tasks = [asyncio.ensure_future(generate_indexed(i, prompt)) for i, prompt in enumerate(prompts)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # The caller may stop iterating early
+            for task in tasks:
+                task.cancel()
@@ -1,17 +1,47 @@
 import os
 import json
 import logging
-from typing import Dict, Any, Optional, List
+import hashlib
+import datetime
+import threading
+import time
+from typing import Dict, Any, Optional, List, AsyncIterator
 import asyncio
 import aiohttp
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 import google.generativeai as genai
 from google.generativeai.types import GenerateContentResponse
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+try:
+    from google.generativeai import caching
+except ImportError:
+    # Older google-generativeai releases have no context caching API
+    caching = None
+
+try:
+    from google.api_core import exceptions as google_exceptions
+except ImportError:
+    google_exceptions = None
+
+from ..utils.llm_cache import ResponseCache
+from .base import LLMServiceBase
+from .retry import CircuitBreaker, RETRYABLE_STATUS_CODES, retry_async
+
+# Logging is configured by the application entry point
 logger = logging.getLogger(__name__)
 
+# How long a server-side cached system prompt lives, and how close to expiry it gets refreshed
+CONTEXT_CACHE_TTL = datetime.timedelta(minutes=10)
+CONTEXT_CACHE_REFRESH_MARGIN = datetime.timedelta(minutes=1)
+
+# Seconds a fetched model list is reused by the health/availability checks
+MODELS_CACHE_TTL = 300
+
+# Output token limits for single synchronous calls (a reasonable default for summarization) and async calls;
+# an async call that answers for several marshaled chunks gets ASYNC_MAX_OUTPUT_TOKENS per chunk
+SYNC_MAX_OUTPUT_TOKENS = 5000
+ASYNC_MAX_OUTPUT_TOKENS = 2048
+
 @dataclass
 class GeminiResponse:
     """Response from Gemini API."""
@@ -20,11 +50,18 @@ class GeminiResponse:
     prompt_tokens: Optional[int] = None
     completion_tokens: Optional[int] = None
     total_tokens: Optional[int] = None
+    # Prompt tokens served from Gemini's context cache
+    cached_tokens: Optional[int] = None
+    # Set instead of content when this prompt failed in a non-strict batch
+    error: Optional[str] = None
 
-class GeminiService:
+class GeminiService(LLMServiceBase):
     """Service for interacting with Google Gemini API."""
     
-    def __init__(self, api_key: str, model: str = "gemini-pro", timeout: int = 300):
+    def __init__(self, api_key: str, model: str = "gemini-pro", timeout: int = 300,
+                 response_cache: Optional[ResponseCache] = None,
+                 concurrency: int = 8,
+                 max_retries: int = 3):
         """
         Initialize Gemini service.
         
@@ -32,27 +69,181 @@ class GeminiService:
             api_key: Google Gemini API key
             model: Model name to use (e.g., "gemini-pro")
             timeout: Request timeout in seconds
+            response_cache: Cache for deterministic responses (a default one is created if omitted)
+            concurrency: Maximum number of generation requests in flight at once
+            max_retries: Retries for async generations failing with a transient error
         """
         self.api_key = api_key
         self.model_name = model
         self.timeout = timeout
         genai.configure(api_key=self.api_key)
         self.model = genai.GenerativeModel(self.model_name)
-        self.session = None # aiohttp session for async operations if needed for direct http calls
-
-    async def __aenter__(self):
-        """Async context manager entry."""
-        # For google-generativeai, aiohttp.ClientSession might not be directly used
-        # as the library handles its own async HTTP.
-        # However, if we were to make direct HTTP calls, we'd initialize it here.
-        self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout))
-        return self
-    
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
-        if self.session:
-            await self.session.close()
-    
+        # The aiohttp session is only for direct HTTP calls; google-generativeai
+        # handles its own async HTTP
+        self._init_session_state()
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.circuit_breaker = CircuitBreaker()
+        self._models_cache: Optional[tuple] = None  # (fetched_at, list of models)
+        self._model_info: Optional[Dict[str, Any]] = None
+        # Per-call constants, built once and shared by every request
+        self._request_options = {"timeout": self.timeout}
+        self._generation_configs: Dict[tuple, Dict[str, Any]] = {}
+        self.response_cache = response_cache if response_cache is not None else ResponseCache()
+        # System prompt hash -> (CachedContent or None, model bound to that system prompt)
+        self._system_models: Dict[str, tuple] = {}
+        self._system_models_lock = threading.Lock()
+
+    def _get_cached(self, key: Optional[str]) -> Optional[GeminiResponse]:
+        """Return a cached response with zeroed token counts, or None on a miss."""
+        if key is None:
+            return None
+        cached = self.response_cache.get(key)
+        if cached is None:
+            return None
+        logger.info("Serving cached response for Gemini model '%s'", self.model_name)
+        return self._as_cached(cached)
+
+    def _get_model(self, system_prompt: Optional[str]):
+        """
+        Get a model bound to a system prompt.
+
+        The system prompt is stored server-side with Gemini context caching so
+        repeated requests reference it instead of resending it; the cache's TTL
+        is extended as it nears expiry. Models or prompts that context caching
+        rejects (e.g. too short) fall back to a plain system instruction.
+
+        Args:
+            system_prompt: Optional system prompt
+
+        Returns:
+            GenerativeModel to send the user prompt to
+        """
+        if not system_prompt:
+            return self.model
+
+        key = hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()
+        with self._system_models_lock:
+            entry = self._system_models.get(key)
+            if entry is not None:
+                cached_content, model = entry
+                if cached_content is None:
+                    return model
+                now = datetime.datetime.now(datetime.timezone.utc)
+                if cached_content.expire_time - now > CONTEXT_CACHE_REFRESH_MARGIN:
+                    return model
+                try:
+                    cached_content.update(ttl=CONTEXT_CACHE_TTL)
+                    return model
+                except Exception as e:
+                    logger.warning("Could not refresh cached system prompt, recreating it: %s", e)
+
+            cached_content = None
+            try:
+                if caching is None:
+                    raise RuntimeError("context caching is not available in this google-generativeai version")
+                cached_content = caching.CachedContent.create(
+                    model=self.model_name,
+                    system_instruction=system_prompt,
+                    ttl=CONTEXT_CACHE_TTL
+                )
+                model = genai.GenerativeModel.from_cached_content(cached_content)
+                logger.info("Cached system prompt for Gemini model '%s' as %s", self.model_name, cached_content.name)
+            except Exception as e:
+                logger.info("Context caching unavailable, sending system prompt as a system instruction: %s", e)
+                cached_content = None
+                model = genai.GenerativeModel(self.model_name, system_instruction=system_prompt)
+
+            self._system_models[key] = (cached_content, model)
+            return model
+
+    def _generation_config(self, temperature: float, max_output_tokens: int) -> Dict[str, Any]:
+        """Get the generation config for a temperature/token limit, built once per combination."""
+        key = (temperature, max_output_tokens)
+        config = self._generation_configs.get(key)
+        if config is None:
+            config = {"temperature": temperature, "max_output_tokens": max_output_tokens}
+            self._generation_configs[key] = config
+        return config
+
+    def _output_token_budget(self, requested: Optional[int]) -> int:
+        """Output token limit for an async call, capped at the model's own limit when it is known."""
+        if requested is None:
+            return ASYNC_MAX_OUTPUT_TOKENS
+        model_limit = (self._model_info or {}).get("output_token_limit")
+        return min(requested, model_limit) if model_limit else requested
+
+    def _to_gemini_response(self, response: GenerateContentResponse) -> GeminiResponse:
+        """Build a GeminiResponse from an API response, including token usage."""
+        usage = response.usage_metadata
+        prompt_tokens = usage.prompt_token_count if usage else None
+        cached_tokens = getattr(usage, "cached_content_token_count", None) if usage else None
+        if cached_tokens and prompt_tokens:
+            logger.info("Context cache hit ratio: %d/%d prompt tokens", cached_tokens, prompt_tokens)
+        return GeminiResponse(
+            content=self._response_text(response),
+            model=self.model_name,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=usage.candidates_token_count if usage else None,
+            total_tokens=usage.total_token_count if usage else None,
+            cached_tokens=cached_tokens
+        )
+
+    @staticmethod
+    def _response_text(response: GenerateContentResponse) -> str:
+        """Join the text parts of the first candidate in one pass, trimmed."""
+        if not response.candidates:
+            return ""
+        return "".join(part.text for part in response.candidates[0].content.parts).strip()
+
+    @staticmethod
+    def _as_cached(response: GeminiResponse) -> GeminiResponse:
+        """Copy a cached response with its token counts zeroed."""
+        return replace(response, prompt_tokens=0, completion_tokens=0, total_tokens=0, cached_tokens=0)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Get response cache hit/miss counters.
+
+        Returns:
+            Dictionary with cache statistics
+        """
+        return self.response_cache.stats()
+
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        """Check whether an API error is worth retrying (rate limit, server error, timeout)."""
+        if google_exceptions is not None and isinstance(error, google_exceptions.GoogleAPICallError):
+            return error.code in RETRYABLE_STATUS_CODES or isinstance(error, google_exceptions.DeadlineExceeded)
+        return isinstance(error, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
+
+    async def _generate_content_async(self, model, prompt: str, generation_config: Dict[str, Any]) -> GenerateContentResponse:
+        """Call generate_content_async under the concurrency limit, retrying transient failures."""
+        async def generate_once() -> GenerateContentResponse:
+            async with self._get_semaphore():
+                return await model.generate_content_async(
+                    prompt,
+                    generation_config=generation_config,
+                    request_options=self._request_options
+                )
+
+        return await retry_async(generate_once, self._is_retryable, self.circuit_breaker, self.max_retries)
+
+    def _find_model(self):
+        """
+        Find this service's model in the (cached) Gemini model list.
+
+        The list is fetched at most once per MODELS_CACHE_TTL seconds and shared
+        by test_connection, check_model_availability and get_model_info.
+
+        Returns:
+            The matching model, or None if it is not listed
+        """
+        now = time.monotonic()
+        if self._models_cache is None or now - self._models_cache[0] >= MODELS_CACHE_TTL:
+            self._models_cache = (now, list(genai.list_models()))
+        return next((m for m in self._models_cache[1] if self.model_name in m.name), None)
+
     def test_connection(self) -> bool:
         """
         Test connection to Gemini API by listing models.
@@ -63,38 +254,48 @@ class GeminiService:
         logger.info("Attempting to test connection to Gemini API.")
         try:
             # Attempt to list models to verify API key and connectivity
-            for m in genai.list_models():
-                if self.model_name in m.name:
-                    logger.info(f"Successfully connected to Gemini and found model '{self.model_name}'.")
-                    return True
-            logger.warning(f"Failed to find model '{self.model_name}' or connect to Gemini.")
+            if self._find_model() is not None:
+                logger.info("Successfully connected to Gemini and found model '%s'.", self.model_name)
+                return True
+            logger.warning("Failed to find model '%s' or connect to Gemini.", self.model_name)
             return False
         except Exception as e:
-            logger.error(f"Error testing connection to Gemini: {e}")
+            logger.error("Error testing connection to Gemini: %s", e)
             return False
     
+    def warm_up(self) -> bool:
+        """
+        Open the connection to the Gemini API ahead of the first real request.
+
+        Returns:
+            True if the API is reachable and the model was found, False otherwise
+        """
+        return self.test_connection()
+
     def check_model_availability(self) -> bool:
         """
         Check if the specified model is available.
         Returns:
             True if model is available, False otherwise
         """
-        logger.info(f"Checking availability of model '{self.model_name}' for Gemini.")
+        logger.info("Checking availability of model '%s' for Gemini.", self.model_name)
         try:
-            for m in genai.list_models():
-                if self.model_name in m.name:
-                    logger.info(f"Model '{self.model_name}' is available.")
-                    return True
-            logger.warning(f"Model '{self.model_name}' not found in available Gemini models.")
+            if self._find_model() is not None:
+                logger.info("Model '%s' is available.", self.model_name)
+                return True
+            logger.warning("Model '%s' not found in available Gemini models.", self.model_name)
             return False
         except Exception as e:
-            logger.error(f"Error checking Gemini model availability: {e}")
+            logger.error("Error checking Gemini model availability: %s", e)
             return False
 
     def generate_sync(self, prompt: str, temperature: float = 0.3, system_prompt: Optional[str] = None) -> GeminiResponse:
         """
         Generate text synchronously using Gemini.
 
+        Blocks until the response arrives; from async code use
+        generate_sync_in_executor so the event loop keeps running.
+
         Args:
             prompt: Input prompt
             temperature: Temperature for generation
@@ -103,48 +304,36 @@ class GeminiService:
         Returns:
             GeminiResponse object
         """
-        logger.info(f"Sending synchronous generation request to Gemini for model '{self.model_name}'")
+        if self._in_event_loop():
+            logger.warning("generate_sync called from a running event loop; use generate_sync_in_executor instead")
+        cache_key = self.response_cache.key(self.model_name, prompt, system_prompt, temperature)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+
+        logger.info("Sending synchronous generation request to Gemini for model '%s'", self.model_name)
         try:
-            generation_config = {
-                "temperature": temperature,
-                "max_output_tokens": 5000 # A reasonable default for summarization
-            }
+            generation_config = self._generation_config(temperature, SYNC_MAX_OUTPUT_TOKENS)
             
-            contents = []
-            if system_prompt:
-                contents.append({"role": "user", "parts": [system_prompt]})
-                contents.append({"role": "model", "parts": ["Okay, I understand."]}) # Acknowledge system prompt
-            contents.append({"role": "user", "parts": [prompt]})
-
-            response: GenerateContentResponse = self.model.generate_content(
-                contents,
+            model = self._get_model(system_prompt)
+            response: GenerateContentResponse = model.generate_content(
+                prompt,
                 generation_config=generation_config,
-                request_options={"timeout": self.timeout}
+                request_options=self._request_options
             )
             
-            response_text = ""
-            if response.candidates:
-                for part in response.candidates[0].content.parts:
-                    response_text += part.text
-            
-            prompt_tokens = response.usage_metadata.prompt_token_count if response.usage_metadata else None
-            completion_tokens = response.usage_metadata.candidates_token_count if response.usage_metadata else None
-            total_tokens = response.usage_metadata.total_token_count if response.usage_metadata else None
-
-            logger.info(f"Synchronous generation successful for model '{self.model_name}'.")
-            return GeminiResponse(
-                content=response_text.strip(),
-                model=self.model_name,
-                prompt_tokens=prompt_tokens,
-                completion_tokens=completion_tokens,
-                total_tokens=total_tokens
-            )
+            logger.info("Synchronous generation successful for model '%s'.", self.model_name)
+            gemini_response = self._to_gemini_response(response)
+            if cache_key is not None:
+                self.response_cache.set(cache_key, gemini_response)
+            return gemini_response
 
         except Exception as e:
-            logger.error(f"Error communicating with Gemini during synchronous generation: {str(e)}")
+            logger.error("Error communicating with Gemini during synchronous generation: %s", e)
             raise Exception(f"Error communicating with Gemini: {str(e)}")
 
-    async def generate_async(self, prompt: str, temperature: float = 0.3, system_prompt: Optional[str] = None) -> GeminiResponse:
+    async def generate_async(self, prompt: str, temperature: float = 0.3, system_prompt: Optional[str] = None,
+                             max_output_tokens: Optional[int] = None) -> GeminiResponse:
         """
         Generate text asynchronously using Gemini.
 
@@ -152,127 +341,144 @@ class GeminiService:
             prompt: Input prompt
             temperature: Temperature for generation
             system_prompt: Optional system prompt
+            max_output_tokens: Output token limit (defaults to ASYNC_MAX_OUTPUT_TOKENS; capped
+                at the model's output limit once its info has been fetched)
 
         Returns:
             GeminiResponse object
         """
-        logger.info(f"Sending asynchronous generation request to Gemini for model '{self.model_name}'")
+        cache_key = self.response_cache.key(self.model_name, prompt, system_prompt, temperature)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+
+        logger.info("Sending asynchronous generation request to Gemini for model '%s'", self.model_name)
         try:
-            generation_config = {
-                "temperature": temperature,
-                "max_output_tokens": 2048
-            }
-            
-            contents = []
-            if system_prompt:
-                contents.append({"role": "user", "parts": [system_prompt]})
-                contents.append({"role": "model", "parts": ["Okay, I understand."]})
-            contents.append({"role": "user", "parts": [prompt]})
-
-            response: GenerateContentResponse = await self.model.generate_content_async(
-                contents,
-                generation_config=generation_config,
-                request_options={"timeout": self.timeout}
-            )
+            generation_config = self._generation_config(temperature, self._output_token_budget(max_output_tokens))
             
-            response_text = ""
-            if response.candidates:
-                for part in response.candidates[0].content.parts:
-                    response_text += part.text
+            # Creating or refreshing a context cache is a blocking call
+            model = await asyncio.to_thread(self._get_model, system_prompt) if system_prompt else self.model
+            response = await self._generate_content_async(model, prompt, generation_config)
             
-            prompt_tokens = response.usage_metadata.prompt_token_count if response.usage_metadata else None
-            completion_tokens = response.usage_metadata.candidates_token_count if response.usage_metadata else None
-            total_tokens = response.usage_metadata.total_token_count if response.usage_metadata else None
-
-            logger.info(f"Asynchronous generation successful for model '{self.model_name}'.")
-            return GeminiResponse(
-                content=response_text.strip(),
-                model=self.model_name,
-                prompt_tokens=prompt_tokens,
-                completion_tokens=completion_tokens,
-                total_tokens=total_tokens
-            )
+            logger.info("Asynchronous generation successful for model '%s'.", self.model_name)
+            gemini_response = self._to_gemini_response(response)
+            if cache_key is not None:
+                self.response_cache.set(cache_key, gemini_response)
+            return gemini_response
 
         except Exception as e:
-            logger.error(f"Error communicating with Gemini during asynchronous generation: {str(e)}")
+            logger.error("Error communicating with Gemini during asynchronous generation: %s", e)
             raise Exception(f"Error communicating with Gemini: {str(e)}")
 
-    async def generate_multiple_async(self, prompts: List[str], temperature: float = 0.3, system_prompt: Optional[str] = None) -> List[GeminiResponse]:
+    async def generate_stream_async(self, prompt: str, temperature: float = 0.3, system_prompt: Optional[str] = None) -> AsyncIterator[str]:
+        """
+        Generate text asynchronously, yielding pieces as Gemini produces them.
+
+        Responses are not cached on this path. Uses the synchronous output token
+        limit, since streaming is meant for long outputs such as a final summary.
+
+        Args:
+            prompt: Input prompt
+            temperature: Temperature for generation
+            system_prompt: Optional system prompt
+
+        Yields:
+            Generated text pieces
+        """
+        logger.info("Sending streaming generation request to Gemini for model '%s'", self.model_name)
+        generation_config = self._generation_config(temperature, SYNC_MAX_OUTPUT_TOKENS)
+        model = await asyncio.to_thread(self._get_model, system_prompt) if system_prompt else self.model
+        async with self._get_semaphore():
+            response = await model.generate_content_async(
+                prompt,
+                generation_config=generation_config,
+                request_options=self._request_options,
+                stream=True
+            )
+            async for chunk in response:
+                if not chunk.candidates:
+                    continue
+                # Pieces are passed on unstripped so they join back up exactly
+                text = "".join(part.text for part in chunk.candidates[0].content.parts)
+                if text:
+                    yield text
+
+    async def generate_multiple_async(self, prompts: List[str], temperature: float = 0.3, system_prompt: Optional[str] = None,
+                                      strict: bool = False) -> List[GeminiResponse]:
         """
         Generate text for multiple prompts concurrently.
 
+        A failing prompt doesn't discard the rest of the batch: its slot holds an
+        empty response with `error` set, so callers can retry just those prompts.
+
         Args:
             prompts: List of input prompts
             temperature: Temperature for generation
             system_prompt: Optional system prompt
+            strict: Raise the first error instead, discarding the other results
 
         Returns:
-            List of GeminiResponse objects
+            List of GeminiResponse objects, in prompt order
         """
-        logger.info(f"Sending {len(prompts)} concurrent asynchronous generation requests for Gemini model '{self.model_name}'")
+        logger.info("Sending %s concurrent asynchronous generation requests for Gemini model '%s'", len(prompts), self.model_name)
         
-        tasks = []
-        for prompt in prompts:
-            contents = []
-            if system_prompt:
-                contents.append({"role": "user", "parts": [system_prompt]})
-                contents.append({"role": "model", "parts": ["Okay, I understand."]})
-            contents.append({"role": "user", "parts": [prompt]})
-            
-            generation_config = {
-                "temperature": temperature,
-                "max_output_tokens": 2048
-            }
-            
-            tasks.append(self.model.generate_content_async(
-                contents,
-                generation_config=generation_config,
-                request_options={"timeout": self.timeout}
-            ))
+        model = await asyncio.to_thread(self._get_model, system_prompt) if system_prompt else self.model
+        generation_config = self._generation_config(temperature, ASYNC_MAX_OUTPUT_TOKENS)
+        
+        tasks = [self._generate_content_async(model, prompt, generation_config) for prompt in prompts]
 
         try:
-            responses: List[GenerateContentResponse] = await asyncio.gather(*tasks)
-            
-            results = []
-            for response in responses:
-                response_text = ""
-                if response.candidates:
-                    for part in response.candidates[0].content.parts:
-                        response_text += part.text
-                
-                prompt_tokens = response.usage_metadata.prompt_token_count if response.usage_metadata else None
-                completion_tokens = response.usage_metadata.candidates_token_count if response.usage_metadata else None
-                total_tokens = response.usage_metadata.total_token_count if response.usage_metadata else None
-                
-                results.append(GeminiResponse(
-                    content=response_text.strip(),
-                    model=self.model_name,
-                    prompt_tokens=prompt_tokens,
-                    completion_tokens=completion_tokens,
-                    total_tokens=total_tokens
-                ))
-            
-            logger.info(f"Successfully completed {len(results)} concurrent asynchronous generations for Gemini.")
-            return results
+            responses = await asyncio.gather(*tasks, return_exceptions=not strict)
         except Exception as e:
-            logger.error(f"An error occurred during concurrent asynchronous generation with Gemini: {e}")
+            logger.error("An error occurred during concurrent asynchronous generation with Gemini: %s", e)
             raise
 
+        results = [
+            self._to_gemini_response(response) if not isinstance(response, Exception)
+            else self._failed_response(index, len(prompts), response)
+            for index, response in enumerate(responses)
+        ]
+        logger.info("Completed %s concurrent asynchronous generations for Gemini.", len(results))
+        return results
+
+    def _failed_response(self, index: int, total: int, error: Exception) -> GeminiResponse:
+        """Log a failed batch prompt and build the empty response that stands in for it."""
+        logger.error("Gemini generation failed for prompt %d of %d: %s", index + 1, total, error)
+        return GeminiResponse(content="", model=self.model_name, error=str(error))
+
     def get_model_info(self) -> Dict[str, Any]:
         """
         Get information about the current model.
 
+        The first successful result is kept for the lifetime of the service;
+        call refresh_model_info() to fetch it again.
+
         Returns:
             Model information dictionary
         """
-        logger.info(f"Requesting model info for '{self.model_name}' from Gemini.")
+        if self._model_info is not None:
+            return self._model_info
+
+        logger.info("Requesting model info for '%s' from Gemini.", self.model_name)
         try:
-            for m in genai.list_models():
-                if self.model_name in m.name:
-                    logger.info(f"Successfully retrieved model info for '{self.model_name}'.")
-                    return m.to_dict()
-            logger.warning(f"Model '{self.model_name}' not found when getting info.")
+            m = self._find_model()
+            if m is not None:
+                logger.info("Successfully retrieved model info for '%s'.", self.model_name)
+                self._model_info = m.to_dict()
+                return self._model_info
+            logger.warning("Model '%s' not found when getting info.", self.model_name)
             return {"error": f"Model '{self.model_name}' not found."}
         except Exception as e:
-            logger.error(f"Could not get model info for '{self.model_name}': {e}")
+            logger.error("Could not get model info for '%s': %s", self.model_name, e)
             return {"error": f"Could not get model info: {str(e)}"}
+
+    def refresh_model_info(self) -> Dict[str, Any]:
+        """
+        Drop the stored model information and model list and fetch them again.
+
+        Returns:
+            Model information dictionary
+        """
+        self._model_info = None
+        self._models_cache = None
+        return self.get_model_info()
@@ -1,16 +1,46 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, AsyncIterator, Coroutine, TypeVar
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import aiohttp
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 import time
+import bisect
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+from ..utils.llm_cache import ResponseCache
+from .base import LLMServiceBase
+from .retry import CircuitBreaker, RETRYABLE_STATUS_CODES, retry_async
+
+# orjson parses the streamed generation lines and serializes request bodies
+# several times faster than the stdlib; fall back to json when not installed.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so error handling is shared.
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+# Logging is configured by the application entry point
 logger = logging.getLogger(__name__)
 
+# Seconds a fetched /api/tags response is reused by the connection and model checks
+TAGS_CACHE_TTL = 30
+
+# Seconds allowed for opening a connection; timing out here is transient and retried,
+# unlike the total request timeout, which a long generation can legitimately reach
+CONNECT_TIMEOUT = 10
+
+T = TypeVar("T")
+
 @dataclass
 class OllamaResponse:
     """Response from Ollama API."""
@@ -20,11 +50,20 @@ class OllamaResponse:
     load_duration: Optional[int] = None
     prompt_eval_count: Optional[int] = None
     eval_count: Optional[int] = None
+    # Set instead of content when this prompt failed in a non-strict batch
+    error: Optional[str] = None
 
-class OllamaService:
+class OllamaStreamError(Exception):
+    """Raised when a streamed generation reports an error or ends before its final (done) message."""
+
+class OllamaService(LLMServiceBase):
     """Service for interacting with Ollama API."""
     
-    def __init__(self, base_url: str = "http://localhost:11434", model: str = "llama3.1:8b", timeout: int = 500):
+    def __init__(self, base_url: str = "http://localhost:11434", model: str = "llama3.1:8b", timeout: int = 500,
+                 response_cache: Optional[ResponseCache] = None,
+                 concurrency: int = 8,
+                 max_retries: int = 3,
+                 keep_alive: Optional[str] = "10m"):
         """
         Initialize Ollama service.
         
@@ -32,69 +71,281 @@ class OllamaService:
             base_url: Base URL for Ollama API
             model: Model name to use
             timeout: Request timeout in seconds
+            response_cache: Cache for deterministic responses (a default one is created if omitted)
+            concurrency: Maximum number of generation requests in flight at once
+            max_retries: Retries for async generations failing with a transient error
+            keep_alive: How long Ollama keeps the model loaded after each request (None for the server default)
         """
         self.base_url = base_url.rstrip('/')
         self.model = model
         self.timeout = timeout
-        self.session = None
+        self._init_session_state()
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.keep_alive = keep_alive
+        self.circuit_breaker = CircuitBreaker()
+        self._tags_cache: Optional[tuple] = None  # (fetched_at, parsed /api/tags response, sorted model names)
+        self._payload_template: Optional[tuple] = None  # ((temperature, system_prompt), payload without prompt)
+        self._model_info: Optional[Dict[str, Any]] = None
+        
+        # Pooled keep-alive connections for the synchronous calls, instead of a
+        # new TCP connection per requests.get/post
+        self.sync_session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=Retry(total=2, backoff_factor=0.2))
+        self.sync_session.mount("http://", adapter)
+        self.sync_session.mount("https://", adapter)
+        self.response_cache = response_cache if response_cache is not None else ResponseCache()
+    
+    def _get_cached(self, key: Optional[str]) -> Optional[OllamaResponse]:
+        """Return a cached response with zeroed token counts, or None on a miss."""
+        if key is None:
+            return None
+        cached = self.response_cache.get(key)
+        if cached is None:
+            return None
+        logger.info("Serving cached response for model '%s'", self.model)
+        return self._as_cached(cached)
+    
+    @staticmethod
+    def _as_cached(response: OllamaResponse) -> OllamaResponse:
+        """Copy a cached response with its usage counters zeroed."""
+        return replace(response, total_duration=0, load_duration=0, prompt_eval_count=0, eval_count=0)
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Get response cache hit/miss counters.
+        
+        Returns:
+            Dictionary with cache statistics
+        """
+        return self.response_cache.stats()
+    
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        """
+        Check whether an async request error is worth retrying (rate limit, server error, dropped connection).
+        
+        Of the timeouts only a connect timeout is retried: a generation that ran
+        into the total timeout would just be restarted from scratch.
+        """
+        if isinstance(error, aiohttp.ClientResponseError):
+            return error.status in RETRYABLE_STATUS_CODES
+        if isinstance(error, aiohttp.ServerTimeoutError):
+            return isinstance(error, aiohttp.ConnectionTimeoutError)
+        return isinstance(error, aiohttp.ClientConnectionError)
+    
+    def _new_session(self) -> aiohttp.ClientSession:
+        """Create the aiohttp session, keeping connections to Ollama alive between requests."""
+        # Keep-alive sockets are reused across requests; the semaphore keeps at
+        # most `concurrency` generations in flight so Ollama isn't flooded
+        connector = aiohttp.TCPConnector(limit=32, limit_per_host=self.concurrency, keepalive_timeout=60)
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout, sock_connect=CONNECT_TIMEOUT)
+        )
+    
+    def close(self) -> None:
+        """Close the pooled connections used by the synchronous calls."""
+        self.sync_session.close()
+    
+    async def _get_tags_async(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the parsed /api/tags response, reusing one fetched in the last TAGS_CACHE_TTL seconds.
+        
+        Uses the session opened by the async context manager when it belongs to
+        the running loop, or a short-lived one otherwise (e.g. from the sync
+        wrappers).
+        
+        Returns:
+            Parsed response, or None if Ollama answered with an error status
+        """
+        now = time.monotonic()
+        if self._tags_cache is not None and now - self._tags_cache[0] < TAGS_CACHE_TTL:
+            return self._tags_cache[1]
+        
+        url = f"{self.base_url}/api/tags"
+        timeout = aiohttp.ClientTimeout(total=10)
+        session = self.session
+        if session is None or session.closed or self._session_loop is not asyncio.get_running_loop():
+            async with aiohttp.ClientSession(timeout=timeout) as own_session:
+                return await self._fetch_tags(own_session, url, timeout, now)
+        return await self._fetch_tags(session, url, timeout, now)
+    
+    async def _fetch_tags(self, session: aiohttp.ClientSession, url: str, timeout: aiohttp.ClientTimeout, now: float) -> Optional[Dict[str, Any]]:
+        """GET /api/tags with the given session and cache a successful response."""
+        async with session.get(url, timeout=timeout) as response:
+            if response.status != 200:
+                logger.warning("Ollama returned status code %s for %s", response.status, url)
+                return None
+            tags = await response.json()
+        self._tags_cache = (now, tags, None)
+        return tags
     
-    async def __aenter__(self):
-        """Async context manager entry."""
-        self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout))
-        return self
+    def _has_model(self) -> bool:
+        """Check whether the cached /api/tags response lists this service's model."""
+        fetched_at, tags, names = self._tags_cache
+        if names is None:
+            # Sorted once per fetch so repeated checks are a binary search
+            names = tuple(sorted(model['name'] for model in tags.get('models', [])))
+            self._tags_cache = (fetched_at, tags, names)
+        # Names starting with the model name sort directly at or after it
+        index = bisect.bisect_left(names, self.model)
+        if index < len(names) and names[index].startswith(self.model):
+            logger.info("Model '%s' is available.", self.model)
+            return True
+        logger.warning("Model '%s' not found in Ollama models.", self.model)
+        return False
     
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
-        if self.session:
-            await self.session.close()
+    def _run_sync(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Run a coroutine to completion from synchronous code.
+        
+        Called from inside a running event loop, the coroutine gets its own
+        loop on a worker thread; this still blocks the caller, so async code
+        should await the coroutine directly.
+        """
+        if not self._in_event_loop():
+            return asyncio.run(coro)
+        logger.warning("Synchronous Ollama check called from a running event loop; await the async version instead")
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
     
     def test_connection(self) -> bool:
         """
-        Test connection to Ollama server.
+        Test connection to Ollama server (synchronous wrapper around test_connection_async).
         
         Returns:
             True if connection successful, False otherwise
         """
-        url = f"{self.base_url}/api/tags"
-        logger.info(f"Attempting to test connection to Ollama at {url}")
+        return self._run_sync(self.test_connection_async())
+    
+    async def test_connection_async(self) -> bool:
+        """
+        Test connection to Ollama server without blocking the event loop.
+        
+        Returns:
+            True if connection successful, False otherwise
+        """
+        logger.info("Attempting to test connection to Ollama at %s", self.base_url)
         try:
-            response = requests.get(url, timeout=10)
-            if response.status_code == 200:
+            if await self._get_tags_async() is not None:
                 logger.info("Successfully connected to Ollama.")
                 return True
-            else:
-                logger.warning(f"Failed to connect to Ollama. Status code: {response.status_code}")
+            logger.warning("Failed to connect to Ollama.")
             return False
         except Exception as e:
-            logger.error(f"Error testing connection to Ollama: {e}")
+            logger.error("Error testing connection to Ollama: %s", e)
             return False
     
+    def warm_up(self) -> bool:
+        """
+        Load the model into Ollama's memory ahead of the first real request.
+
+        Ollama loads a model when it receives a generate request without a
+        prompt, so the first chunk summary doesn't pay the cold-load time.
+
+        Returns:
+            True if the model was loaded, False otherwise
+        """
+        if not self.test_connection():
+            return False
+        url = f"{self.base_url}/api/generate"
+        logger.info("Warming up model '%s' at %s", self.model, url)
+        try:
+            response = self.sync_session.post(
+                url,
+                json=self._warm_up_payload(),
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            logger.info("Model '%s' loaded.", self.model)
+            return True
+        except Exception as e:
+            logger.warning("Could not warm up model '%s': %s", self.model, e)
+            return False
+
+    def _warm_up_payload(self) -> Dict[str, Any]:
+        """Build the prompt-less /api/generate request body that makes Ollama load the model."""
+        payload = {"model": self.model, "stream": False}
+        if self.keep_alive is not None:
+            payload["keep_alive"] = self.keep_alive
+        return payload
+
     def check_model_availability(self) -> bool:
         """
-        Check if the specified model is available.
+        Check if the specified model is available (synchronous wrapper around check_model_availability_async).
+        
         Returns:
             True if model is available, False otherwise
         """
-        url = f"{self.base_url}/api/tags"
-        logger.info(f"Checking availability of model '{self.model}' at {url}")
+        return self._run_sync(self.check_model_availability_async())
+
+    async def check_model_availability_async(self) -> bool:
+        """
+        Check if the specified model is available without blocking the event loop.
+        
+        Returns:
+            True if model is available, False otherwise
+        """
+        logger.info("Checking availability of model '%s' at %s", self.model, self.base_url)
         try:
-            response = requests.get(url, timeout=10)
-            if response.status_code == 200:
-                models = response.json().get('models', [])
-                if any(model['name'].startswith(self.model) for model in models):
-                    logger.info(f"Model '{self.model}' is available.")
-                    return True
-                else:
-                    logger.warning(f"Model '{self.model}' not found in Ollama models.")
-            return False
+            return await self._get_tags_async() is not None and self._has_model()
         except Exception as e:
-            logger.error(f"Error checking model availability: {e}")
+            logger.error("Error checking model availability: %s", e)
             return False
 
+    def _generate_payload(self, prompt: str, temperature: float, system_prompt: Optional[str]) -> Dict[str, Any]:
+        """
+        Build a streaming /api/generate request body.
+
+        Everything but the prompt is shared by a batch of requests, so that part
+        is built once per (temperature, system prompt) and only the prompt is
+        swapped in per request.
+        """
+        template_key = (temperature, system_prompt)
+        if self._payload_template is None or self._payload_template[0] != template_key:
+            template = {
+                "model": self.model,
+                # Streamed so the server sends tokens as they are produced instead
+                # of buffering the whole completion
+                "stream": True,
+                "options": {
+                    "temperature": temperature,
+                    "num_predict": -1  # Generate until natural stopping point
+                }
+            }
+            if system_prompt:
+                template["system"] = system_prompt
+            if self.keep_alive is not None:
+                # Keep the model resident between calls instead of reloading it
+                template["keep_alive"] = self.keep_alive
+            self._payload_template = (template_key, template)
+        return {**self._payload_template[1], "prompt": prompt}
+
+    @staticmethod
+    def _check_message(message: Dict[str, Any]) -> None:
+        """Raise if a streamed message carries an error; Ollama reports mid-stream failures on an HTTP 200 response."""
+        if message.get("error"):
+            raise OllamaStreamError(f"Ollama reported an error mid-stream: {message['error']}")
+
+    def _response_from_stream(self, parts: List[str], final: Dict[str, Any]) -> OllamaResponse:
+        """Assemble a response from streamed text pieces and the final (done) message."""
+        return OllamaResponse(
+            content="".join(parts),
+            model=final.get("model", self.model),
+            total_duration=final.get("total_duration"),
+            load_duration=final.get("load_duration"),
+            prompt_eval_count=final.get("prompt_eval_count"),
+            eval_count=final.get("eval_count")
+        )
+
     def generate_sync(self, prompt: str, temperature: float = 0.3, system_prompt: Optional[str] = None) -> OllamaResponse:
         """
         Generate text synchronously using Ollama.
 
+        Blocks until the response arrives; from async code use
+        generate_sync_in_executor so the event loop keeps running.
+
         Args:
             prompt: Input prompt
             temperature: Temperature for generation
@@ -103,50 +354,58 @@ class OllamaService:
         Returns:
             OllamaResponse object
         """
-        url = f"{self.base_url}/api/generate"
-
-        payload = {
-            "model": self.model,
-            "prompt": prompt,
-            "stream": False,
-            "options": {
-                "temperature": temperature,
-                "num_predict": -1  # Generate until natural stopping point
-            }
-        }
+        if self._in_event_loop():
+            logger.warning("generate_sync called from a running event loop; use generate_sync_in_executor instead")
+        cache_key = self.response_cache.key(self.model, prompt, system_prompt, temperature)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
 
-        if system_prompt:
-            payload["system"] = system_prompt
+        url = f"{self.base_url}/api/generate"
+        payload = self._generate_payload(prompt, temperature, system_prompt)
 
-        logger.info(f"Sending synchronous generation request to {url} for model '{self.model}'")
+        logger.info("Sending synchronous generation request to %s for model '%s'", url, self.model)
         try:
-            response = requests.post(
+            response = self.sync_session.post(
                 url,
-                json=payload,
+                data=_json_dumps(payload),
                 timeout=self.timeout,
-                headers={"Content-Type": "application/json"}
+                headers={"Content-Type": "application/json"},
+                stream=True
             )
-            response.raise_for_status()
+            try:
+                response.raise_for_status()
+                parts: List[str] = []
+                final: Dict[str, Any] = {}
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    message = _json_loads(line)
+                    self._check_message(message)
+                    parts.append(message.get("response", ""))
+                    if message.get("done"):
+                        final = message
+                        break
+            finally:
+                response.close()
+            if not final:
+                # A truncated summary must not be returned (and cached) as a complete one
+                raise OllamaStreamError("Ollama stream ended before the final (done) message")
 
-            result = response.json()
-            logger.info(f"Synchronous generation successful for model '{self.model}'.")
-            return OllamaResponse(
-                content=result.get("response", ""),
-                model=result.get("model", self.model),
-                total_duration=result.get("total_duration"),
-                load_duration=result.get("load_duration"),
-                prompt_eval_count=result.get("prompt_eval_count"),
-                eval_count=result.get("eval_count")
-            )
+            logger.info("Synchronous generation successful for model '%s'.", self.model)
+            ollama_response = self._response_from_stream(parts, final)
+            if cache_key is not None:
+                self.response_cache.set(cache_key, ollama_response)
+            return ollama_response
 
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error communicating with Ollama during synchronous generation: {str(e)}")
+            logger.error("Error communicating with Ollama during synchronous generation: %s", e)
             raise Exception(f"Error communicating with Ollama: {str(e)}")
         except json.JSONDecodeError as e:
-            logger.error(f"Error parsing Ollama response during synchronous generation: {str(e)}")
+            logger.error("Error parsing Ollama response during synchronous generation: %s", e)
             raise Exception(f"Error parsing Ollama response: {str(e)}")
         except Exception as e:
-            logger.error(f"An unexpected error occurred during synchronous generation: {str(e)}")
+            logger.error("An unexpected error occurred during synchronous generation: %s", e)
             raise Exception(f"Error communicating with Ollama: {str(e)}")
 
     async def generate_async(self, prompt: str, temperature: float = 0.3, system_prompt: Optional[str] = None) -> OllamaResponse:
@@ -161,103 +420,173 @@ class OllamaService:
         Returns:
             OllamaResponse object
         """
+        cache_key = self.response_cache.key(self.model, prompt, system_prompt, temperature)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+
         if not self.session:
             logger.error("Aiohttp session not initialized for asynchronous generation.")
             raise Exception("Session not initialized. Use async context manager.")
 
-        url = f"{self.base_url}/api/generate"
-
-        payload = {
-            "model": self.model,
-            "prompt": prompt,
-            "stream": False,
-            "options": {
-                "temperature": temperature,
-                "num_predict": -1
-            }
-        }
-
-        if system_prompt:
-            payload["system"] = system_prompt
+        async def generate_once() -> OllamaResponse:
+            parts: List[str] = []
+            final: Dict[str, Any] = {}
+            async for message in self._stream_messages_async(prompt, temperature, system_prompt):
+                parts.append(message.get("response", ""))
+                if message.get("done"):
+                    final = message
+            return self._response_from_stream(parts, final)
 
-        logger.info(f"Sending asynchronous generation request to {url} for model '{self.model}'")
+        logger.info("Sending asynchronous generation request for model '%s'", self.model)
         try:
-            async with self.session.post(url, json=payload) as response:
-                response.raise_for_status()
-                result = await response.json()
-
-                logger.info(f"Asynchronous generation successful for model '{self.model}'.")
-                return OllamaResponse(
-                    content=result.get("response", ""),
-                    model=result.get("model", self.model),
-                    total_duration=result.get("total_duration"),
-                    load_duration=result.get("load_duration"),
-                    prompt_eval_count=result.get("prompt_eval_count"),
-                    eval_count=result.get("eval_count")
-                )
+            # The whole stream is collected per attempt, so a retry never duplicates text
+            ollama_response = await retry_async(
+                generate_once, self._is_retryable, self.circuit_breaker, self.max_retries
+            )
+
+            logger.info("Asynchronous generation successful for model '%s'.", self.model)
+            if cache_key is not None:
+                self.response_cache.set(cache_key, ollama_response)
+            return ollama_response
 
         except aiohttp.ClientError as e:
-            logger.error(f"Aiohttp client error during asynchronous generation: {e}")
+            logger.error("Aiohttp client error during asynchronous generation: %s", e)
             raise Exception(f"Error communicating with Ollama: {str(e)}")
         except json.JSONDecodeError as e:
-            logger.error(f"Error parsing Ollama response during asynchronous generation: {e}")
+            logger.error("Error parsing Ollama response during asynchronous generation: %s", e)
             raise Exception(f"Error parsing Ollama response: {str(e)}")
         except Exception as e:
-            logger.error(f"An unexpected error occurred during asynchronous generation: {e}")
+            logger.error("An unexpected error occurred during asynchronous generation: %s", e)
             raise Exception(f"Error : {str(e)}")
 
-    async def generate_multiple_async(self, prompts: List[str], temperature: float = 0.3, system_prompt: Optional[str] = None) -> List[OllamaResponse]:
+    async def _stream_messages_async(self, prompt: str, temperature: float, system_prompt: Optional[str]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield the parsed JSON messages of a streamed generation, up to the final (done) one.
+
+        Raises:
+            OllamaStreamError: If a message carries an error or the stream closes without a done message
+        """
+        url = f"{self.base_url}/api/generate"
+        payload = self._generate_payload(prompt, temperature, system_prompt)
+        async with self._get_semaphore(), self.session.post(
+            url, data=_json_dumps(payload), headers={"Content-Type": "application/json"}
+        ) as response:
+            response.raise_for_status()
+            async for line in response.content:
+                line = line.strip()
+                if not line:
+                    continue
+                message = _json_loads(line)
+                self._check_message(message)
+                yield message
+                if message.get("done"):
+                    return
+        raise OllamaStreamError("Ollama stream ended before the final (done) message")
+
+    async def generate_stream_async(self, prompt: str, temperature: float = 0.3, system_prompt: Optional[str] = None) -> AsyncIterator[str]:
+        """
+        Generate text asynchronously, yielding pieces as Ollama produces them.
+
+        Responses are not cached on this path.
+
+        Args:
+            prompt: Input prompt
+            temperature: Temperature for generation
+            system_prompt: Optional system prompt
+
+        Yields:
+            Generated text pieces
+        """
+        if not self.session:
+            logger.error("Aiohttp session not initialized for streaming generation.")
+            raise Exception("Session not initialized. Use async context manager.")
+
+        logger.info("Sending streaming generation request for model '%s'", self.model)
+        async for message in self._stream_messages_async(prompt, temperature, system_prompt):
+            text = message.get("response", "")
+            if text:
+                yield text
+
+    async def generate_multiple_async(self, prompts: List[str], temperature: float = 0.3, system_prompt: Optional[str] = None,
+                                      strict: bool = False) -> List[OllamaResponse]:
         """
         Generate text for multiple prompts concurrently.
 
+        A failing prompt doesn't discard the rest of the batch: its slot holds an
+        empty response with `error` set, so callers can retry just those prompts.
+
         Args:
             prompts: List of input prompts
             temperature: Temperature for generation
             system_prompt: Optional system prompt
+            strict: Raise the first error instead, discarding the other results
 
         Returns:
-            List of OllamaResponse objects
+            List of OllamaResponse objects, in prompt order
         """
         if not self.session:
             logger.error("Aiohttp session not initialized for multiple asynchronous generations.")
             raise Exception("Session not initialized. Use async context manager.")
 
-        logger.info(f"Sending {len(prompts)} concurrent asynchronous generation requests for model '{self.model}'")
+        logger.info("Sending %s concurrent asynchronous generation requests for model '%s'", len(prompts), self.model)
         tasks = [
             self.generate_async(prompt, temperature, system_prompt)
             for prompt in prompts
         ]
 
         try:
-            results = await asyncio.gather(*tasks)
-            logger.info(f"Successfully completed {len(results)} concurrent asynchronous generations.")
-            return results
+            results = await asyncio.gather(*tasks, return_exceptions=not strict)
         except Exception as e:
-            logger.error(f"An error occurred during concurrent asynchronous generation: {e}")
+            logger.error("An error occurred during concurrent asynchronous generation: %s", e)
             raise
 
+        for index, result in enumerate(results):
+            if isinstance(result, Exception):
+                logger.error("Generation failed for prompt %d of %d: %s", index + 1, len(prompts), result)
+                results[index] = OllamaResponse(content="", model=self.model, error=str(result))
+        logger.info("Completed %s concurrent asynchronous generations.", len(results))
+        return results
+
     def get_model_info(self) -> Dict[str, Any]:
         """
         Get information about the current model.
 
+        The first successful response is kept for the lifetime of the service;
+        call refresh_model_info() to fetch it again.
+
         Returns:
             Model information dictionary
         """
+        if self._model_info is not None:
+            return self._model_info
+
         url = f"{self.base_url}/api/show"
-        logger.info(f"Requesting model info for '{self.model}' from {url}")
+        logger.info("Requesting model info for '%s' from %s", self.model, url)
         try:
-            response = requests.post(
+            response = self.sync_session.post(
                 url,
                 json={"name": self.model},
                 timeout=10
             )
             response.raise_for_status()
-            logger.info(f"Successfully retrieved model info for '{self.model}'.")
-            return response.json()
+            logger.info("Successfully retrieved model info for '%s'.", self.model)
+            self._model_info = response.json()
+            return self._model_info
         except Exception as e:
-            logger.error(f"Could not get model info for '{self.model}': {e}")
+            logger.error("Could not get model info for '%s': %s", self.model, e)
             return {"error": f"Could not get model info: {str(e)}"}
 
+    def refresh_model_info(self) -> Dict[str, Any]:
+        """
+        Drop the stored model information and fetch it again.
+
+        Returns:
+            Model information dictionary
+        """
+        self._model_info = None
+        return self.get_model_info()
+
     def pull_model(self) -> bool:
         """
         Pull the model if it's not available locally.
@@ -266,20 +595,23 @@ class OllamaService:
             True if successful, False otherwise
         """
         url = f"{self.base_url}/api/pull"
-        logger.info(f"Attempting to pull model '{self.model}' from {url}")
+        logger.info("Attempting to pull model '%s' from %s", self.model, url)
         try:
-            response = requests.post(
+            response = self.sync_session.post(
                 url,
                 json={"name": self.model},
                 timeout=600  # Model pulling can take a while
             )
             if response.status_code == 200:
-                logger.info(f"Successfully initiated pull for model '{self.model}'.")
+                logger.info("Successfully initiated pull for model '%s'.", self.model)
+                # The model list and details have changed, so refetch them on the next check
+                self._tags_cache = None
+                self._model_info = None
                 return True
             else:
-                logger.warning(f"Failed to pull model '{self.model}'. Status code: {response.status_code}")
+                logger.warning("Failed to pull model '%s'. Status code: %s", self.model, response.status_code)
                 return False
         except Exception as e:
-            logger.error(f"Error pulling model '{self.model}': {e}")
+            logger.error("Error pulling model '%s': %s", self.model, e)
             return False
 
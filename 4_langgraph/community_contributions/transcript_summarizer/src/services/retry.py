@@ -0,0 +1,112 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+from collections import deque
+from typing import Awaitable, Callable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# HTTP statuses worth retrying: rate limiting and transient server errors
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a backend that has been failing recently."""
+
+class CircuitBreaker:
+    """
+    Fails calls fast while a backend's recent failure rate is too high.
+
+    The outcomes of the last `window` calls are tracked. Once at least
+    `min_calls` have been recorded and the share of failures reaches
+    `failure_threshold`, the breaker opens for `cooldown_s` seconds. After
+    the cooldown calls are let through again with a fresh window.
+    """
+
+    def __init__(self, failure_threshold: float = 0.5, window: int = 20, min_calls: int = 5, cooldown_s: float = 30.0):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            failure_threshold: Share of failed calls in the window that opens the breaker
+            window: Number of recent call outcomes considered
+            min_calls: Minimum number of outcomes before the breaker can open
+            cooldown_s: Seconds the breaker stays open
+        """
+        self.failure_threshold = failure_threshold
+        self.min_calls = min_calls
+        self.cooldown_s = cooldown_s
+        self._outcomes: deque = deque(maxlen=window)
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Check whether a call may go to the backend."""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at < self.cooldown_s:
+                return False
+            # Cooldown over: try the backend again, judged on new outcomes only
+            self._opened_at = None
+            self._outcomes.clear()
+            return True
+
+    def record(self, success: bool) -> None:
+        """Record the outcome of a call, opening the breaker if failures dominate the window."""
+        with self._lock:
+            self._outcomes.append(success)
+            if self._opened_at is not None or len(self._outcomes) < self.min_calls:
+                return
+            failures = self._outcomes.count(False)
+            if failures / len(self._outcomes) >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+                logger.warning(
+                    "Circuit breaker opened after %d/%d failed calls; failing fast for %.0fs",
+                    failures, len(self._outcomes), self.cooldown_s
+                )
+
+async def retry_async(call: Callable[[], Awaitable[T]], is_retryable: Callable[[Exception], bool],
+                      breaker: Optional[CircuitBreaker] = None, max_retries: int = 3,
+                      base_delay: float = 0.5, max_delay: float = 8.0) -> T:
+    """
+    Await a call, retrying transient failures with jittered exponential backoff.
+
+    Args:
+        call: Function returning a new awaitable for each attempt
+        is_retryable: Whether an exception is a transient backend failure
+        breaker: Optional circuit breaker consulted before and updated after each attempt
+        max_retries: Number of retries after the first attempt
+        base_delay: Backoff before the first retry, in seconds
+        max_delay: Upper bound on a single backoff, in seconds
+
+    Returns:
+        Result of the first successful attempt
+
+    Raises:
+        CircuitOpenError: If the breaker is open
+        Exception: The last error once retries are exhausted, or any non-retryable error
+    """
+    for attempt in range(max_retries + 1):
+        if breaker is not None and not breaker.allow():
+            raise CircuitOpenError("Backend is failing; circuit breaker is open")
+        try:
+            result = await call()
+        except Exception as e:
+            if not is_retryable(e):
+                raise
+            if breaker is not None:
+                breaker.record(False)
+            if attempt == max_retries:
+                raise
+            # "Full jitter": spread retries from concurrent callers apart
+            delay = random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+            logger.warning("Transient error (%s), retrying in %.2fs (attempt %d/%d)", e, delay, attempt + 1, max_retries)
+            await asyncio.sleep(delay)
+        else:
+            if breaker is not None:
+                breaker.record(True)
+            return result
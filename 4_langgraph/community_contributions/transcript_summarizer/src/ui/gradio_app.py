@@ -1,21 +1,82 @@
 import gradio as gr
+import asyncio
 import tempfile
 import os
 import logging
-from typing import Optional, Tuple, Dict, Any
+import shutil
+import time
+from typing import Optional, Tuple, Dict, Any, AsyncIterator
 import json
 
 from ..core.summarizer import TranscriptSummarizer, SummarizationResult
-from ..utils.config import Config
+from ..utils.config import Config, get_config
 from ..services.ollama_service import OllamaService # For Ollama-specific health check info
 from ..services.gemini_service import GeminiService # For Gemini-specific health check info
 
 # Set up logging for debugging using config
-config_instance = Config()
-log_level = getattr(logging, config_instance.log_level.upper(), logging.INFO)
-logging.basicConfig(level=log_level)
+config_instance = get_config()
+logging.basicConfig(level=config_instance.log_level_int)
 logger = logging.getLogger(__name__)
 
+# Seconds a health check report is reused before the LLM service is probed again
+HEALTH_CHECK_TTL = 30
+
+# Summaries waiting for a free worker before new ones are turned away
+QUEUE_MAX_SIZE = 32
+
+# Statistics markdown, filled in with one format_map call per render
+_STATS_TEMPLATE = """## Processing Statistics
+
+**Original Length:** {original_length:,} characters
+**Summary Length:** {summary_length:,} characters
+**Compression Ratio:** {compression_ratio:.1f}x
+**Chunks Processed:** {chunks_processed}
+**Processing Time:** {processing_time:.2f} seconds
+
+**Efficiency:** {efficiency:.0f} characters/second"""
+
+def _format_statistics(original_length: int, summary_length: int, compression_ratio: float,
+                       chunks_processed: int, processing_time: float) -> str:
+    """Render the statistics markdown for a single summarization result."""
+    return _STATS_TEMPLATE.format_map({
+        "original_length": original_length,
+        "summary_length": summary_length,
+        "compression_ratio": compression_ratio,
+        "chunks_processed": chunks_processed,
+        "processing_time": processing_time,
+        "efficiency": original_length / processing_time if processing_time > 0 else 0
+    })
+
+def _write_upload_to_tempfile(file_obj, buffer_size: int) -> str:
+    """
+    Spill uploaded VTT content to a temporary file.
+    
+    Blocking; called through asyncio.to_thread so the event loop stays free.
+    File objects are copied in buffer_size pieces, so a large upload is never
+    held in memory in full.
+    
+    Args:
+        file_obj: Uploaded content, as a string or a readable file object
+        buffer_size: Bytes (or characters) copied per read
+        
+    Returns:
+        Path of the temporary file (the caller deletes it)
+    """
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.vtt', delete=False) as tmp_file:
+        if isinstance(file_obj, str):
+            tmp_file.write(file_obj)
+        else:
+            shutil.copyfileobj(file_obj, tmp_file, length=buffer_size)
+        return tmp_file.name
+
+def _remove_file(file_path: str) -> None:
+    """Delete a temporary file, ignoring errors."""
+    try:
+        os.unlink(file_path)
+        logger.info("🧹 GRADIO DEBUG: Cleaned up temporary file")
+    except OSError:
+        pass
+
 def create_gradio_interface(config: Config) -> gr.Interface:
     """
     Create and configure the Gradio interface for the transcript summarizer.
@@ -34,79 +95,104 @@ def create_gradio_interface(config: Config) -> gr.Interface:
         file_obj,
         chunk_size: int,
         chunk_overlap: int,
-        temperature: float
-    ) -> Tuple[str, str, str]:
+        temperature: float,
+        marshal_batch_size: int
+    ) -> AsyncIterator[Tuple[str, str, str]]:
         """
-        Process uploaded VTT file and return summary with statistics.
+        Process uploaded VTT file, streaming the summary into the UI, then add statistics.
         
         Args:
             file_obj: Uploaded file object
             chunk_size: Maximum tokens per chunk
             chunk_overlap: Overlap between chunks
             temperature: LLM temperature
+            marshal_batch_size: Chunks summarized per Gemini request
             
-        Returns:
-            Tuple of (summary, statistics, status_message)
+        Yields:
+            Tuples of (summary, statistics, status_message); the summary grows while it is generated
         """
         if file_obj is None:
-            return "", "", "❌ Please upload a VTT file."
+            yield "", "", "❌ Please upload a VTT file."
+            return
         
+        temp_path = None
         try:
             logger.info("🎬 GRADIO DEBUG: Starting VTT file processing")
-            logger.info(f"🔧 GRADIO CONFIG DEBUG: Received from UI - chunk_size={chunk_size}, chunk_overlap={chunk_overlap}, temperature={temperature}")
+            logger.debug(
+                "🔧 GRADIO CONFIG DEBUG: Received from UI - chunk_size=%s, chunk_overlap=%s, temperature=%s, marshal_batch_size=%s",
+                chunk_size, chunk_overlap, temperature, marshal_batch_size
+            )
             
             # Read file content
             if hasattr(file_obj, 'name'):
                 file_path = file_obj.name
-                logger.info(f"📂 GRADIO DEBUG: Processing file at path: {file_path}")
+                logger.info("📂 GRADIO DEBUG: Processing file at path: %s", file_path)
+            elif isinstance(file_obj, str) and os.path.isfile(file_obj):
+                # gr.File(type="filepath") hands over the upload's path
+                file_path = file_obj
+                logger.info("📂 GRADIO DEBUG: Processing file at path: %s", file_path)
             else:
-                # Handle case where file_obj is just the content
-                with tempfile.NamedTemporaryFile(mode='w', suffix='.vtt', delete=False) as tmp_file:
-                    if isinstance(file_obj, str):
-                        tmp_file.write(file_obj)
-                    else:
-                        tmp_file.write(file_obj.read())
-                    file_path = tmp_file.name
-                logger.info(f"📂 GRADIO DEBUG: Created temporary file at: {file_path}")
+                # Handle case where file_obj is just the content; the disk write
+                # runs on a worker thread so other requests aren't held up
+                file_path = temp_path = await asyncio.to_thread(_write_upload_to_tempfile, file_obj, config.upload_buffer_size)
+                logger.info("📂 GRADIO DEBUG: Created temporary file at: %s", file_path)
             
             # Process the file with the provided configuration
             logger.info("🚀 GRADIO DEBUG: Calling summarizer with configuration from UI")
-            result = await summarizer.summarize_vtt_file(
+            result = None
+            async for partial_summary, result in summarizer.summarize_vtt_file_stream(
                 file_path, 
                 chunk_size=chunk_size, 
                 chunk_overlap=chunk_overlap, 
-                temperature=temperature
-            )
-            
-            # Clean up temporary file if created
-            if hasattr(file_obj, 'name') and file_path != file_obj.name:
-                try:
-                    os.unlink(file_path)
-                    logger.info("🧹 GRADIO DEBUG: Cleaned up temporary file")
-                except:
-                    pass
+                temperature=temperature,
+                marshal_batch_size=int(marshal_batch_size)
+            ):
+                if result is None:
+                    yield partial_summary, "", "⏳ Generating summary..."
             
             if result.error:
-                logger.error(f"❌ GRADIO DEBUG: Summarization error: {result.error}")
-                return "", "", f"❌ Error: {result.error}"
+                logger.error("❌ GRADIO DEBUG: Summarization error: %s", result.error)
+                yield "", "", f"❌ Error: {result.error}"
+                return
             
             # Format statistics
             stats = format_statistics(result)
             
             # Success message
             status_msg = f"✅ Summary generated successfully! Processed {result.chunks_processed} chunks in {result.processing_time:.2f} seconds."
-            logger.info(f"✅ GRADIO DEBUG: Processing completed successfully - {status_msg}")
+            logger.info("✅ GRADIO DEBUG: Processing completed successfully - %s", status_msg)
             
-            return result.summary, stats, status_msg
+            yield result.summary, stats, status_msg
             
         except Exception as e:
-            logger.error(f"❌ GRADIO DEBUG: Exception in process_vtt_file: {str(e)}")
-            return "", "", f"❌ Error processing file: {str(e)}"
+            logger.error("❌ GRADIO DEBUG: Exception in process_vtt_file: %s", e)
+            yield "", "", f"❌ Error processing file: {str(e)}"
+        finally:
+            # Clean up temporary file if created
+            if temp_path is not None:
+                await asyncio.to_thread(_remove_file, temp_path)
+    
+    health_cache: Optional[Tuple[float, str]] = None  # (checked_at, report)
     
-    def check_system_health() -> str:
-        """Check system health and return status."""
+    async def check_system_health() -> str:
+        """
+        Check system health and return status.
+        
+        A healthy report is reused for HEALTH_CHECK_TTL seconds; a failed one is
+        not cached, so the check can be repeated as soon as the service is fixed.
+        """
+        nonlocal health_cache
+        now = time.monotonic()
+        if health_cache is not None and now - health_cache[0] < HEALTH_CHECK_TTL:
+            return health_cache[1]
+        report, healthy = await _check_system_health()
+        health_cache = (now, report) if healthy else None
+        return report
+    
+    async def _check_system_health() -> Tuple[str, bool]:
+        """Probe the LLM service and build the health report, returned with whether the service is healthy."""
         try:
-            health = summarizer.check_service_health()
+            health = await summarizer.check_service_health()
             
             status_lines = ["## System Health Check", ""]
             
@@ -160,27 +246,39 @@ def create_gradio_interface(config: Config) -> gr.Interface:
                 f"- Temperature: {config.temperature}"
             ])
             
-            return "\n".join(status_lines)
+            return "\n".join(status_lines), health["connection_ok"] and health["model_available"]
             
         except Exception as e:
-            logger.error(f"❌ Health check failed: {str(e)}")
-            return f"❌ Health check failed: {str(e)}"
+            logger.error("❌ Health check failed: %s", e)
+            return f"❌ Health check failed: {str(e)}", False
+    
+    async def switch_llm_provider(provider: str) -> None:
+        """Point the summarizer at another LLM provider and close the previous one's connections."""
+        nonlocal health_cache
+        # Copy the already-loaded config instead of building a new Config(),
+        # which would re-read .env and re-validate every setting on each toggle
+        copy_config = getattr(config, "model_copy", None) or config.copy
+        provider_config = copy_config(update={"llm_provider": provider})
+        previous_service = summarizer.llm_service
+        summarizer.llm_service = summarizer._initialize_llm_service(provider_config)
+        # The summarizer and this UI share `config`; keep it in step with the service
+        config.llm_provider = provider
+        # A report for the previous provider no longer applies
+        health_cache = None
+        logger.info("🔄 GRADIO DEBUG: Switched LLM provider to %s", provider)
+        # Services keep their pooled connections open between requests; aclose()
+        # is deferred until summaries still running on the previous service finish
+        await previous_service.aclose()
     
     def format_statistics(result: SummarizationResult) -> str:
         """Format processing statistics for display."""
-        stats_lines = [
-            "## Processing Statistics",
-            "",
-            f"**Original Length:** {result.original_length:,} characters",
-            f"**Summary Length:** {result.summary_length:,} characters", 
-            f"**Compression Ratio:** {result.compression_ratio:.1f}x",
-            f"**Chunks Processed:** {result.chunks_processed}",
-            f"**Processing Time:** {result.processing_time:.2f} seconds",
-            "",
-            f"**Efficiency:** {result.original_length / result.processing_time:.0f} characters/second"
-        ]
-        
-        return "\n".join(stats_lines)
+        return _format_statistics(
+            result.original_length,
+            result.summary_length,
+            result.compression_ratio,
+            result.chunks_processed,
+            result.processing_time
+        )
     
     # Create the Gradio interface
     with gr.Blocks(
@@ -269,6 +367,15 @@ def create_gradio_interface(config: Config) -> gr.Interface:
                     info="Creativity level (0.0 = focused, 1.0 = creative)"
                 )
                 
+                marshal_batch_size_input = gr.Slider(
+                    minimum=1,
+                    maximum=8,
+                    value=config.marshal_batch_size,
+                    step=1,
+                    label="Chunks per Request",
+                    info="Chunks summarized in one Gemini request (Ollama always uses 1)"
+                )
+                
                 # Action buttons
                 with gr.Row():
                     summarize_btn = gr.Button(
@@ -337,26 +444,25 @@ def create_gradio_interface(config: Config) -> gr.Interface:
         # Event handlers
         summarize_btn.click(
             fn=process_vtt_file,
-            inputs=[file_input, chunk_size_input, chunk_overlap_input, temperature_input],
-            outputs=[summary_output, stats_output, status_output]
+            inputs=[file_input, chunk_size_input, chunk_overlap_input, temperature_input, marshal_batch_size_input],
+            outputs=[summary_output, stats_output, status_output],
+            # Gradio runs one event at a time per listener by default; let
+            # uploads be summarized side by side up to the request limit
+            concurrency_limit=config.max_concurrent_requests
         )
         
         health_btn.click(
             fn=check_system_health,
             outputs=[health_output]
         )
-        
-        # Auto-run health check on startup
-        interface.load(
-            fn=check_system_health,
-            outputs=[health_output]
-        )
 
         # Update summarizer config when LLM provider changes
         llm_provider_input.change(
-            fn=lambda provider: summarizer._initialize_llm_service(Config(llm_provider=provider)),
+            fn=switch_llm_provider,
             inputs=[llm_provider_input],
             outputs=[]
         )
     
+    interface.queue(max_size=QUEUE_MAX_SIZE, api_open=False)
+    
     return interface
@@ -1,4 +1,6 @@
 import os
+import logging
+from functools import lru_cache
 from typing import Optional
 try:
     from pydantic import BaseSettings, Field
@@ -75,6 +77,26 @@ class Config(BaseSettings):
         description="Request timeout in seconds"
     )
     
+    marshal_batch_size: int = Field(
+        default=4,
+        ge=1,
+        le=8,
+        env="MARSHAL_BATCH_SIZE",
+        description="Chunks summarized per Gemini request (1-8); Ollama always sends one chunk per request"
+    )
+    
+    upload_buffer_size: int = Field(
+        default=1024 * 1024,
+        env="UPLOAD_BUFFER_SIZE",
+        description="Buffer size in bytes for copying uploaded transcripts to disk"
+    )
+    
+    warm_up_llm: bool = Field(
+        default=True,
+        env="WARM_UP_LLM",
+        description="Load the model / open the API connection in the background at startup"
+    )
+    
     # Temperature for LLM
     temperature: float = Field(
         default=0.3,
@@ -82,6 +104,37 @@ class Config(BaseSettings):
         description="Temperature for text generation"
     )
     
+    # Response Cache Configuration
+    cache_enabled: bool = Field(
+        default=False,
+        env="CACHE_ENABLED",
+        description="Cache LLM responses on disk and reuse them for repeated prompts"
+    )
+
+    cache_path: str = Field(
+        default=".cache/llm_cache.sqlite3",
+        env="CACHE_PATH",
+        description="Path to the SQLite response cache"
+    )
+
+    cache_ttl_seconds: int = Field(
+        default=7 * 24 * 3600,
+        env="CACHE_TTL_SECONDS",
+        description="Seconds a cached response stays valid"
+    )
+
+    cache_max_entries: int = Field(
+        default=10000,
+        env="CACHE_MAX_ENTRIES",
+        description="Maximum number of cached responses; the oldest are dropped first"
+    )
+
+    semantic_cache_threshold: Optional[float] = Field(
+        default=None,
+        env="SEMANTIC_CACHE_THRESHOLD",
+        description="Minimum cosine similarity for a semantic cache hit (requires fastembed); unset for exact matches only"
+    )
+
     # Logging Configuration
     log_level: str = Field(
         default="INFO",
@@ -89,10 +142,28 @@ class Config(BaseSettings):
         description="Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)"
     )
     
+    @property
+    def log_level_int(self) -> int:
+        """Numeric logging level for log_level, defaulting to INFO for unknown names."""
+        return getattr(logging, self.log_level.upper(), logging.INFO)
+    
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
         case_sensitive = False
 
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """
+    Get the shared configuration.
+    
+    .env and the environment are read and validated once per process; every
+    later call returns the same instance.
+    
+    Returns:
+        Config instance
+    """
+    return Config()
+
 # Global config instance
-config = Config()
+config = get_config()
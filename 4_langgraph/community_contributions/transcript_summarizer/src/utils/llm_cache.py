@@ -0,0 +1,380 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, Any
+
+try:
+    import numpy as np
+    from fastembed import TextEmbedding
+except ImportError:
+    np = None
+    TextEmbedding = None
+
+logger = logging.getLogger(__name__)
+
+class SemanticCache:
+    """
+    Persistent cache for LLM responses backed by SQLite.
+
+    Responses are looked up by an exact key (sha256 of provider, model,
+    temperature and prompt). When a similarity threshold is given and fastembed
+    is installed, prompts are also embedded so that near-duplicate prompts for
+    the same provider/model/temperature can be served from the cache when their
+    cosine similarity reaches the threshold.
+
+    Entries expire after ttl_seconds, and the oldest are dropped once the table
+    holds more than max_entries rows. Embeddings for semantic lookups are read
+    from the database once per scope and then kept in memory, least recently
+    matched first out when a scope holds more than max_entries of them.
+    """
+
+    def __init__(self, path: str, similarity_threshold: Optional[float] = None,
+                 embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2",
+                 ttl_seconds: Optional[float] = None, max_entries: Optional[int] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            path: Path to the SQLite database file
+            similarity_threshold: Minimum cosine similarity for a semantic hit (None for exact matches only)
+            embedding_model: fastembed model used for semantic lookups
+            ttl_seconds: Seconds an entry stays valid after it is stored (None to keep entries until evicted)
+            max_entries: Maximum number of rows kept; the oldest are deleted first (None for no limit)
+        """
+        self.path = path
+        self.similarity_threshold = similarity_threshold
+        self.embedding_model = embedding_model
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._embedder = None
+        self._semantic_enabled = similarity_threshold is not None and TextEmbedding is not None
+        # scope -> OrderedDict of key -> normalized embedding, loaded on first semantic lookup
+        self._vectors: Dict[str, "OrderedDict[str, Any]"] = {}
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # LangGraph may run sync nodes on a worker thread, so the connection is
+        # shared across threads and guarded by self._lock
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                scope TEXT NOT NULL,
+                response TEXT NOT NULL,
+                embedding BLOB,
+                created_at REAL NOT NULL DEFAULT 0
+            )"""
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(responses)")}
+        if "created_at" not in columns:
+            # Databases from before expiry was added; their rows count as expired
+            self._conn.execute("ALTER TABLE responses ADD COLUMN created_at REAL NOT NULL DEFAULT 0")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_scope ON responses (scope)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_created_at ON responses (created_at)")
+        self._conn.commit()
+
+        if similarity_threshold is not None and TextEmbedding is None:
+            logger.info("fastembed not installed, semantic cache lookups disabled (exact matches only)")
+
+    @staticmethod
+    def _scope(provider: str, model: str, temperature: float) -> str:
+        return f"{provider}\x1f{model}\x1f{temperature}"
+
+    @staticmethod
+    def _key(scope: str, prompt: str) -> str:
+        return hashlib.sha256(f"{scope}\x1f{prompt}".encode("utf-8")).hexdigest()
+
+    @classmethod
+    def make_key(cls, text: str, provider: str, model: str, temperature: float) -> str:
+        """
+        Build a key for get_by_key/set_by_key from the same fields as prompt lookups.
+
+        Args:
+            text: Text the value was derived from
+            provider: LLM provider name
+            model: Model name
+            temperature: Sampling temperature
+
+        Returns:
+            Cache key
+        """
+        return cls._key(cls._scope(provider, model, temperature), text)
+
+    def _cutoff(self) -> float:
+        """Oldest created_at that is still valid."""
+        if self.ttl_seconds is None:
+            return float("-inf")
+        return time.time() - self.ttl_seconds
+
+    def _insert(self, key: str, scope: str, value: str, blob: Optional[bytes]) -> None:
+        """Store a row and drop expired rows and rows over max_entries. Caller holds self._lock."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses (key, scope, response, embedding, created_at) VALUES (?, ?, ?, ?, ?)",
+            (key, scope, value, blob, time.time())
+        )
+        if self.ttl_seconds is not None:
+            self._conn.execute("DELETE FROM responses WHERE created_at < ?", (self._cutoff(),))
+        if self.max_entries is not None:
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN "
+                "(SELECT key FROM responses ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+        self._conn.commit()
+
+    def _scope_vectors(self, scope: str, cutoff: float) -> "OrderedDict[str, Any]":
+        """Get the in-memory embeddings of a scope, reading them from the database the first time. Caller holds self._lock."""
+        vectors = self._vectors.get(scope)
+        if vectors is None:
+            rows = self._conn.execute(
+                "SELECT key, embedding FROM responses "
+                "WHERE scope = ? AND embedding IS NOT NULL AND created_at >= ? ORDER BY created_at",
+                (scope, cutoff)
+            ).fetchall()
+            vectors = self._vectors[scope] = OrderedDict(
+                (key, np.frombuffer(embedding, dtype=np.float32)) for key, embedding in rows
+            )
+        return vectors
+
+    def _embed(self, text: str):
+        """Embed text with the local embedding model, or None if unavailable."""
+        if not self._semantic_enabled:
+            return None
+        try:
+            if self._embedder is None:
+                self._embedder = TextEmbedding(model_name=self.embedding_model)
+            vector = np.asarray(next(iter(self._embedder.embed([text]))), dtype=np.float32)
+            norm = np.linalg.norm(vector)
+            return vector / norm if norm else vector
+        except Exception as e:
+            logger.warning("Disabling semantic cache lookups, embedding failed: %s", e)
+            self._semantic_enabled = False
+            return None
+
+    def get(self, prompt: str, provider: str, model: str, temperature: float) -> Optional[str]:
+        """
+        Look up a cached response for a prompt.
+
+        Args:
+            prompt: Prompt sent to the LLM
+            provider: LLM provider name
+            model: Model name
+            temperature: Sampling temperature
+
+        Returns:
+            Cached response text, or None on a miss
+        """
+        scope = self._scope(provider, model, temperature)
+        key = self._key(scope, prompt)
+
+        cutoff = self._cutoff()
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM responses WHERE key = ? AND created_at >= ?", (key, cutoff)
+            ).fetchone()
+        if row is not None:
+            self.hits += 1
+            return row[0]
+
+        query = self._embed(prompt)
+        if query is not None:
+            with self._lock:
+                vectors = self._scope_vectors(scope, cutoff)
+                if vectors:
+                    keys = list(vectors)
+                    similarities = np.stack(list(vectors.values())) @ query
+                    best = int(np.argmax(similarities))
+                    if similarities[best] >= self.similarity_threshold:
+                        best_key = keys[best]
+                        row = self._conn.execute(
+                            "SELECT response FROM responses WHERE key = ? AND created_at >= ?", (best_key, cutoff)
+                        ).fetchone()
+                        if row is not None:
+                            vectors.move_to_end(best_key)
+                            self.hits += 1
+                            return row[0]
+                        # Expired or dropped from the table since it was loaded
+                        del vectors[best_key]
+
+        self.misses += 1
+        return None
+
+    def set(self, prompt: str, response: str, provider: str, model: str, temperature: float) -> None:
+        """
+        Store a response in the cache.
+
+        Args:
+            prompt: Prompt sent to the LLM
+            response: Response text to cache
+            provider: LLM provider name
+            model: Model name
+            temperature: Sampling temperature
+        """
+        scope = self._scope(provider, model, temperature)
+        embedding = self._embed(prompt)
+        blob = embedding.tobytes() if embedding is not None else None
+
+        key = self._key(scope, prompt)
+
+        with self._lock:
+            self._insert(key, scope, response, blob)
+            vectors = self._vectors.get(scope)
+            if vectors is not None and embedding is not None:
+                vectors[key] = embedding
+                vectors.move_to_end(key)
+                while self.max_entries is not None and len(vectors) > self.max_entries:
+                    vectors.popitem(last=False)
+
+    def get_by_key(self, key: str) -> Optional[str]:
+        """
+        Look up a value stored under a caller-computed key (exact match only).
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if not present
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM responses WHERE key = ? AND created_at >= ?", (key, self._cutoff())
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    def set_by_key(self, key: str, value: str, scope: str = "keyed") -> None:
+        """
+        Store a value under a caller-computed key.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            scope: Scope label; keyed entries are never used for semantic lookups
+        """
+        with self._lock:
+            self._insert(key, scope, value, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache hit/miss counters.
+
+        Returns:
+            Dictionary with hit and miss counts
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "semantic_enabled": self._semantic_enabled
+        }
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class ResponseCache:
+    """
+    In-memory LRU cache with a time-to-live for LLM service responses.
+
+    Only deterministic calls are cached: key() returns None when the temperature
+    is above max_temperature, and callers skip the cache for those requests.
+    """
+
+    def __init__(self, max_size: int = 256, ttl_seconds: float = 3600.0, max_temperature: float = 0.0):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of responses kept; least recently used are evicted first
+            ttl_seconds: Seconds a response stays valid after it is stored
+            max_temperature: Highest temperature whose responses are cached
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.max_temperature = max_temperature
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        # generate_sync may run on worker threads alongside async calls
+        self._lock = threading.Lock()
+
+    def key(self, model: str, prompt: str, system_prompt: Optional[str], temperature: float) -> Optional[str]:
+        """
+        Build the cache key for a request.
+
+        Args:
+            model: Model name
+            prompt: Input prompt
+            system_prompt: Optional system prompt
+            temperature: Sampling temperature
+
+        Returns:
+            Cache key, or None if the request should not be cached
+        """
+        if temperature > self.max_temperature:
+            return None
+        payload = json.dumps(
+            {"model": model, "system": system_prompt, "prompt": prompt, "temp": temperature},
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from key()
+
+        Returns:
+            Cached response, or None on a miss or when the entry has expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, response = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return response
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def set(self, key: str, response: Any) -> None:
+        """
+        Store a response, evicting the least recently used entry when full.
+
+        Args:
+            key: Cache key from key()
+            response: Response to cache
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache hit/miss counters.
+
+        Returns:
+            Dictionary with hit and miss counts and the current size
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries)
+        }
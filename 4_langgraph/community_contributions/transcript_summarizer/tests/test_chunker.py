@@ -59,3 +59,8 @@ class TestTextChunker:
         
         for i, chunk in enumerate(chunks):
             assert chunk.chunk_id == i
+    
+    def test_iter_chunks_matches_lists(self):
+        """Test that the lazy chunk iterator yields the same chunks as the list APIs."""
+        assert list(self.chunker.iter_chunks(self.sample_text)) == self.chunker.chunk_by_sentences(self.sample_text)
+        assert list(self.chunker.iter_chunks(self.sample_text, by_sentences=False)) == self.chunker.chunk_text(self.sample_text)
@@ -5,6 +5,7 @@ Test script to verify .env file loading
 
 import os
 import sys
+import logging
 import pytest
 from pathlib import Path
 
@@ -12,14 +13,14 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.utils.config import Config
+from src.utils.config import Config, get_config
 
 def test_env_loading():
     """Test if .env file values are being loaded correctly."""
     print("🔍 Testing .env file loading...")
     
-    # Create config instance
-    config = Config()
+    # Get the shared config instance
+    config = get_config()
     
     print("\n📊 Configuration Values:")
     print(f"  LLM_PROVIDER: {config.llm_provider}")
@@ -69,8 +70,8 @@ def test_env_loading():
 
 def test_config_defaults():
     """Test that config loads with default values when no .env file exists."""
-    # This will test the default values
-    config = Config()
+    # Build from field defaults only, without reading .env or the environment
+    config = Config.model_construct()
     
     # Test that we get some expected default values
     assert config.llm_provider == "ollama"
@@ -82,9 +83,13 @@ def test_config_defaults():
     assert isinstance(config.chunk_size, int)
     assert isinstance(config.chunk_overlap, int)
 
+def test_get_config_is_cached():
+    """Test that the shared config is loaded once and reused."""
+    assert get_config() is get_config()
+
 def test_config_types():
     """Test that config values have correct types."""
-    config = Config()
+    config = get_config()
     
     assert isinstance(config.llm_provider, str)
     assert isinstance(config.ollama_base_url, str)
@@ -99,5 +104,10 @@ def test_config_types():
     assert isinstance(config.request_timeout, int)
     assert isinstance(config.log_level, str)
 
+def test_log_level_int():
+    """Test that log_level resolves to a logging level, falling back to INFO."""
+    assert Config.model_construct(log_level="debug").log_level_int == logging.DEBUG
+    assert Config.model_construct(log_level="verbose").log_level_int == logging.INFO
+
 if __name__ == "__main__":
     test_env_loading()
@@ -0,0 +1,152 @@
+import sqlite3
+import pytest
+from unittest.mock import patch
+from src.utils.llm_cache import SemanticCache, ResponseCache
+
+class TestSemanticCache:
+    """Test cases for the persistent LLM response cache."""
+
+    @pytest.fixture(autouse=True)
+    def setup_cache(self, tmp_path):
+        """Set up test fixtures."""
+        self.path = str(tmp_path / "cache" / "llm_cache.sqlite3")
+        self.cache = SemanticCache(self.path)
+        yield
+        self.cache.close()
+
+    def test_miss_then_hit(self):
+        """Test that a stored response is returned for the same prompt."""
+        assert self.cache.get("Summarize this", "ollama", "llama3.1:8b", 0.3) is None
+
+        self.cache.set("Summarize this", "A summary", "ollama", "llama3.1:8b", 0.3)
+
+        assert self.cache.get("Summarize this", "ollama", "llama3.1:8b", 0.3) == "A summary"
+        assert self.cache.stats()["hits"] == 1
+        assert self.cache.stats()["misses"] == 1
+
+    def test_key_includes_model_and_temperature(self):
+        """Test that responses are not shared across models or temperatures."""
+        self.cache.set("Summarize this", "A summary", "ollama", "llama3.1:8b", 0.3)
+
+        assert self.cache.get("Summarize this", "ollama", "llama3.1:8b", 0.7) is None
+        assert self.cache.get("Summarize this", "gemini", "gemini-2.5-flash", 0.3) is None
+
+    def test_persists_across_instances(self):
+        """Test that cached responses survive reopening the database."""
+        self.cache.set("Summarize this", "A summary", "ollama", "llama3.1:8b", 0.3)
+        self.cache.close()
+
+        self.cache = SemanticCache(self.path)
+        assert self.cache.get("Summarize this", "ollama", "llama3.1:8b", 0.3) == "A summary"
+
+    def test_keyed_entries(self):
+        """Test storing and reading values under caller-computed keys."""
+        assert self.cache.get_by_key("chunk-key") is None
+
+        self.cache.set_by_key("chunk-key", "Chunk summary", scope="chunk_summary")
+
+        assert self.cache.get_by_key("chunk-key") == "Chunk summary"
+
+    def test_semantic_hit_uses_in_memory_embeddings(self):
+        """Test that a similar prompt is served once the scope's embeddings are loaded, without rereading them."""
+        np = pytest.importorskip("numpy")
+        vectors = {"Summarize this": [1.0, 0.0], "Summarize this!": [0.99, 0.1], "Something else": [0.0, 1.0]}
+
+        def fake_embed(text):
+            vector = np.asarray(vectors[text], dtype=np.float32)
+            return vector / np.linalg.norm(vector)
+
+        self.cache.close()
+        with patch("src.utils.llm_cache.np", np):
+            self.cache = SemanticCache(self.path, similarity_threshold=0.95)
+            self.cache._semantic_enabled = True
+            with patch.object(self.cache, "_embed", side_effect=fake_embed):
+                self.cache.set("Summarize this", "A summary", "ollama", "llama3.1:8b", 0.3)
+                assert self.cache.get("Something else", "ollama", "llama3.1:8b", 0.3) is None
+                assert self.cache.get("Summarize this!", "ollama", "llama3.1:8b", 0.3) == "A summary"
+                assert self.cache.get("Summarize this!", "gemini", "gemini-2.5-flash", 0.3) is None
+
+        assert list(self.cache._vectors[SemanticCache._scope("ollama", "llama3.1:8b", 0.3)]) == [
+            SemanticCache.make_key("Summarize this", "ollama", "llama3.1:8b", 0.3)
+        ]
+
+    def test_make_key_separates_fields(self):
+        """Test that shifting text between fields changes the key."""
+        assert SemanticCache.make_key("textx", "ollama", "y", 0.3) != SemanticCache.make_key("text", "ollama", "xy", 0.3)
+        assert SemanticCache.make_key("text", "ollama", "m", 0.3) != SemanticCache.make_key("text", "gemini", "m", 0.3)
+
+    def test_expired_entries_are_misses(self):
+        """Test that entries older than the TTL are not served."""
+        self.cache.close()
+        self.cache = SemanticCache(self.path, ttl_seconds=60)
+        with patch("src.utils.llm_cache.time.time", return_value=1000.0):
+            self.cache.set("Summarize this", "A summary", "ollama", "llama3.1:8b", 0.3)
+            self.cache.set_by_key("chunk-key", "Chunk summary")
+        with patch("src.utils.llm_cache.time.time", return_value=1061.0):
+            assert self.cache.get("Summarize this", "ollama", "llama3.1:8b", 0.3) is None
+            assert self.cache.get_by_key("chunk-key") is None
+
+    def test_oldest_entries_dropped_over_max_entries(self):
+        """Test that the table is capped at max_entries rows."""
+        self.cache.close()
+        self.cache = SemanticCache(self.path, max_entries=2)
+        for i, prompt in enumerate(["first", "second", "third"]):
+            with patch("src.utils.llm_cache.time.time", return_value=1000.0 + i):
+                self.cache.set(prompt, prompt.upper(), "ollama", "llama3.1:8b", 0.3)
+
+        assert self.cache.get("first", "ollama", "llama3.1:8b", 0.3) is None
+        assert self.cache.get("second", "ollama", "llama3.1:8b", 0.3) == "SECOND"
+        assert self.cache.get("third", "ollama", "llama3.1:8b", 0.3) == "THIRD"
+
+    def test_upgrades_database_without_created_at(self):
+        """Test that a cache file from before expiry was added is migrated."""
+        self.cache.close()
+        legacy_path = self.path + ".legacy"
+        conn = sqlite3.connect(legacy_path)
+        conn.execute("CREATE TABLE responses (key TEXT PRIMARY KEY, scope TEXT NOT NULL, response TEXT NOT NULL, embedding BLOB)")
+        conn.execute("INSERT INTO responses VALUES ('old-key', 'keyed', 'Old summary', NULL)")
+        conn.commit()
+        conn.close()
+
+        self.cache = SemanticCache(legacy_path, ttl_seconds=60)
+
+        assert self.cache.get_by_key("old-key") is None
+        self.cache.set_by_key("new-key", "New summary")
+        assert self.cache.get_by_key("new-key") == "New summary"
+
+
+class TestResponseCache:
+    """Test cases for the in-memory response cache used by the LLM services."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.cache = ResponseCache(max_size=2, ttl_seconds=60)
+
+    def test_only_deterministic_requests_are_keyed(self):
+        """Test that requests above max_temperature are not cached."""
+        assert self.cache.key("llama3.1:8b", "prompt", None, 0.0) is not None
+        assert self.cache.key("llama3.1:8b", "prompt", None, 0.3) is None
+
+    def test_key_includes_system_prompt(self):
+        """Test that the system prompt is part of the key."""
+        assert self.cache.key("m", "prompt", None, 0.0) != self.cache.key("m", "prompt", "Be brief.", 0.0)
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted when full."""
+        self.cache.set("a", "A")
+        self.cache.set("b", "B")
+        assert self.cache.get("a") == "A"
+
+        self.cache.set("c", "C")
+
+        assert self.cache.get("b") is None
+        assert self.cache.get("a") == "A"
+        assert self.cache.get("c") == "C"
+        assert self.cache.stats() == {"hits": 3, "misses": 1, "size": 2}
+
+    def test_expired_entries_are_misses(self):
+        """Test that entries are dropped after their TTL."""
+        with patch("src.utils.llm_cache.time.monotonic", return_value=1000.0):
+            self.cache.set("a", "A")
+        with patch("src.utils.llm_cache.time.monotonic", return_value=1061.0):
+            assert self.cache.get("a") is None
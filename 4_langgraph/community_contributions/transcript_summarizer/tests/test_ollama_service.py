@@ -1,5 +1,9 @@
+import asyncio
+import json
+import aiohttp
+import threading
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from src.services.ollama_service import OllamaService, OllamaResponse
 
 class TestOllamaService:
@@ -13,17 +17,33 @@ class TestOllamaService:
             timeout=30
         )
     
-    @patch('src.services.ollama_service.requests.get')
+    @staticmethod
+    def mock_tags(mock_get, body=None, status=200):
+        """Make a patched aiohttp ClientSession.get answer /api/tags with the given body."""
+        mock_response = Mock()
+        mock_response.status = status
+        mock_response.json = AsyncMock(return_value=body if body is not None else {"models": []})
+        mock_get.return_value.__aenter__.return_value = mock_response
+    
+    @patch('src.services.ollama_service.aiohttp.ClientSession.get')
     def test_test_connection_success(self, mock_get):
         """Test successful connection test."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_get.return_value = mock_response
+        self.mock_tags(mock_get)
         
         result = self.service.test_connection()
         assert result is True
     
-    @patch('src.services.ollama_service.requests.get')
+    @patch('src.services.ollama_service.aiohttp.ClientSession.get')
+    def test_test_connection_from_running_loop(self, mock_get):
+        """Test that the sync wrapper still works when called from a coroutine."""
+        self.mock_tags(mock_get)
+        
+        async def call_sync():
+            return self.service.test_connection()
+        
+        assert asyncio.run(call_sync()) is True
+    
+    @patch('src.services.ollama_service.aiohttp.ClientSession.get')
     def test_test_connection_failure(self, mock_get):
         """Test failed connection test."""
         mock_get.side_effect = Exception("Connection failed")
@@ -31,33 +51,46 @@ class TestOllamaService:
         result = self.service.test_connection()
         assert result is False
     
-    @patch('src.services.ollama_service.requests.get')
+    @patch('src.services.ollama_service.aiohttp.ClientSession.get')
     def test_check_model_availability(self, mock_get):
         """Test model availability check."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        self.mock_tags(mock_get, {
             "models": [
                 {"name": "llama3.1:8b:latest"},
                 {"name": "other-model:latest"}
             ]
-        }
-        mock_get.return_value = mock_response
+        })
         
         result = self.service.check_model_availability()
         assert result is True
     
-    @patch('src.services.ollama_service.requests.post')
+    @patch('src.services.ollama_service.aiohttp.ClientSession.get')
+    def test_check_model_availability_prefix_match(self, mock_get):
+        """Test that the model matches listed names it prefixes, and only those."""
+        self.mock_tags(mock_get, {
+            "models": [{"name": "mistral:latest"}, {"name": "llama3.1:8b-instruct"}, {"name": "gemma:2b"}]
+        })
+        
+        assert self.service.check_model_availability() is True
+        self.service.model = "llama3.2"
+        assert self.service.check_model_availability() is False
+    
+    @patch('src.services.ollama_service.requests.Session.post')
     def test_generate_sync_success(self, mock_post):
         """Test successful synchronous generation."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "response": "This is a test response",
-            "model": "llama3.1:8b",
-            "total_duration": 1000000,
-            "eval_count": 10
-        }
+        mock_response.iter_lines.return_value = [
+            json.dumps({"response": "This is a ", "done": False}).encode(),
+            json.dumps({"response": "test response", "done": False}).encode(),
+            json.dumps({
+                "response": "",
+                "done": True,
+                "model": "llama3.1:8b",
+                "total_duration": 1000000,
+                "eval_count": 10
+            }).encode()
+        ]
         mock_post.return_value = mock_response
         
         result = self.service.generate_sync("Test prompt")
@@ -65,8 +98,10 @@ class TestOllamaService:
         assert isinstance(result, OllamaResponse)
         assert result.content == "This is a test response"
         assert result.model == "llama3.1:8b"
+        assert result.eval_count == 10
+        assert json.loads(mock_post.call_args.kwargs["data"])["stream"] is True
     
-    @patch('src.services.ollama_service.requests.post')
+    @patch('src.services.ollama_service.requests.Session.post')
     def test_generate_sync_failure(self, mock_post):
         """Test failed synchronous generation."""
         mock_post.side_effect = Exception("API Error")
@@ -75,3 +110,237 @@ class TestOllamaService:
             self.service.generate_sync("Test prompt")
         
         assert "Error communicating with Ollama" in str(exc_info.value)
+    
+    @patch('src.services.ollama_service.requests.Session.post')
+    @patch('src.services.ollama_service.aiohttp.ClientSession.get')
+    def test_warm_up_loads_model(self, mock_get, mock_post):
+        """Test that warm-up sends a prompt-less generate request to load the model."""
+        self.mock_tags(mock_get)
+        mock_post.return_value = Mock(status_code=200)
+        
+        result = self.service.warm_up()
+        
+        assert result is True
+        assert mock_post.call_args.kwargs["json"] == {"model": "llama3.1:8b", "stream": False, "keep_alive": "10m"}
+    
+    @patch('src.services.ollama_service.requests.Session.post')
+    @patch('src.services.ollama_service.aiohttp.ClientSession.get')
+    def test_warm_up_skipped_when_unreachable(self, mock_get, mock_post):
+        """Test that warm-up does not try to load the model when Ollama is down."""
+        mock_get.side_effect = Exception("Connection failed")
+        
+        result = self.service.warm_up()
+        
+        assert result is False
+        mock_post.assert_not_called()
+    
+    @patch('src.services.ollama_service.requests.Session.post')
+    def test_generate_sync_caches_deterministic_responses(self, mock_post):
+        """Test that a repeated temperature-0 request is served from the response cache."""
+        mock_response = Mock()
+        mock_response.iter_lines.return_value = [
+            json.dumps({"response": "Cached answer", "done": True, "model": "llama3.1:8b", "eval_count": 10}).encode()
+        ]
+        mock_post.return_value = mock_response
+        
+        first = self.service.generate_sync("Test prompt", temperature=0.0)
+        second = self.service.generate_sync("Test prompt", temperature=0.0)
+        
+        assert mock_post.call_count == 1
+        assert second.content == first.content == "Cached answer"
+        assert second.eval_count == 0
+        assert self.service.cache_stats()["hits"] == 1
+    
+    @patch('src.services.ollama_service.aiohttp.ClientSession.get')
+    def test_model_list_shared_between_checks(self, mock_get):
+        """Test that the connection and model checks share one /api/tags request."""
+        self.mock_tags(mock_get, {"models": [{"name": "llama3.1:8b:latest"}]})
+        
+        assert self.service.test_connection() is True
+        assert self.service.check_model_availability() is True
+        assert mock_get.call_count == 1
+    
+    def test_generate_as_completed_yields_each_result(self):
+        """Test that batch results are yielded individually and failures don't drop the rest."""
+        async def fake_generate(prompt, temperature, system_prompt):
+            if prompt == "bad":
+                raise Exception("API Error")
+            await asyncio.sleep(0.01 if prompt == "slow" else 0)
+            return OllamaResponse(content=prompt.upper(), model="llama3.1:8b")
+        
+        async def collect():
+            return [item async for item in self.service.generate_as_completed_async(["slow", "bad", "fast"])]
+        
+        with patch.object(self.service, "generate_async", side_effect=fake_generate):
+            results = asyncio.run(collect())
+        
+        assert [index for index, _ in results][-1] == 0
+        by_index = dict(results)
+        assert by_index[0].content == "SLOW"
+        assert by_index[2].content == "FAST"
+        assert isinstance(by_index[1], Exception)
+    
+    @patch('src.services.ollama_service.requests.Session.post')
+    def test_model_info_fetched_once(self, mock_post):
+        """Test that model info is kept until explicitly refreshed."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"details": {"family": "llama"}}
+        mock_post.return_value = mock_response
+        
+        assert self.service.get_model_info() == {"details": {"family": "llama"}}
+        self.service.get_model_info()
+        assert mock_post.call_count == 1
+        
+        self.service.refresh_model_info()
+        assert mock_post.call_count == 2
+    
+    def test_generate_sync_in_executor_runs_off_loop(self):
+        """Test that the executor wrapper runs generate_sync on a worker thread."""
+        loop_thread = threading.get_ident()
+        
+        def fake_generate_sync(prompt, temperature, system_prompt):
+            assert threading.get_ident() != loop_thread
+            return OllamaResponse(content=prompt, model="llama3.1:8b")
+        
+        with patch.object(self.service, "generate_sync", side_effect=fake_generate_sync):
+            result = asyncio.run(self.service.generate_sync_in_executor("Test prompt"))
+        
+        assert result.content == "Test prompt"
+    
+    def test_generate_multiple_keeps_partial_results(self):
+        """Test that a failing prompt leaves an error response instead of discarding the batch."""
+        async def fake_generate(prompt, temperature, system_prompt):
+            if prompt == "bad":
+                raise Exception("API Error")
+            return OllamaResponse(content=prompt.upper(), model="llama3.1:8b")
+        
+        self.service.session = Mock()
+        with patch.object(self.service, "generate_async", side_effect=fake_generate):
+            results = asyncio.run(self.service.generate_multiple_async(["one", "bad", "two"]))
+            with pytest.raises(Exception):
+                asyncio.run(self.service.generate_multiple_async(["one", "bad"], strict=True))
+        
+        assert [r.content for r in results] == ["ONE", "", "TWO"]
+        assert results[1].error == "API Error"
+        assert results[0].error is None
+    
+    def test_generate_async_streams_response(self):
+        """Test asynchronous generation over a mocked aiohttp session."""
+        lines = [
+            json.dumps({"response": "Async ", "done": False}).encode() + b"\n",
+            json.dumps({"response": "answer", "done": True, "model": "llama3.1:8b", "eval_count": 5}).encode() + b"\n"
+        ]
+        
+        async def content():
+            for line in lines:
+                yield line
+        
+        mock_response = Mock()
+        mock_response.content = content()
+        mock_request = AsyncMock()
+        mock_request.__aenter__.return_value = mock_response
+        self.service.session = Mock()
+        self.service.session.post.return_value = mock_request
+        
+        result = asyncio.run(self.service.generate_async("Test prompt", temperature=0.5))
+        
+        assert result.content == "Async answer"
+        assert result.eval_count == 5
+        assert json.loads(self.service.session.post.call_args.kwargs["data"])["prompt"] == "Test prompt"
+    
+    def test_only_connect_timeouts_are_retried(self):
+        """Test that a request hitting the total timeout is not restarted, while a connect timeout is."""
+        assert self.service._is_retryable(aiohttp.ConnectionTimeoutError()) is True
+        assert self.service._is_retryable(aiohttp.SocketTimeoutError()) is False
+        assert self.service._is_retryable(asyncio.TimeoutError()) is False
+        assert self.service._is_retryable(aiohttp.ClientConnectionError()) is True
+    
+    def mock_async_stream(self, lines):
+        """Point the service at a mocked aiohttp session that streams the given JSON messages."""
+        async def content():
+            for line in lines:
+                yield json.dumps(line).encode() + b"\n"
+        
+        mock_response = Mock()
+        mock_response.content = content()
+        mock_request = AsyncMock()
+        mock_request.__aenter__.return_value = mock_response
+        self.service.session = Mock()
+        self.service.session.post.return_value = mock_request
+    
+    def test_generate_async_raises_on_stream_error(self):
+        """Test that an error message in an HTTP 200 stream fails the generation instead of returning partial text."""
+        self.mock_async_stream([
+            {"response": "Partial ", "done": False},
+            {"error": "model runner has unexpectedly stopped"}
+        ])
+        
+        with pytest.raises(Exception) as exc_info:
+            asyncio.run(self.service.generate_async("Test prompt", temperature=0.0))
+        
+        assert "unexpectedly stopped" in str(exc_info.value)
+        assert self.service.cache_stats()["size"] == 0
+    
+    def test_generate_async_raises_on_stream_without_done(self):
+        """Test that a stream closing before its done message is not accepted as a complete response."""
+        self.mock_async_stream([{"response": "Truncated", "done": False}])
+        
+        with pytest.raises(Exception) as exc_info:
+            asyncio.run(self.service.generate_async("Test prompt"))
+        
+        assert "done" in str(exc_info.value)
+    
+    @patch('src.services.ollama_service.requests.Session.post')
+    def test_generate_sync_raises_on_stream_error(self, mock_post):
+        """Test that the synchronous path also rejects an error message and a missing done message."""
+        mock_response = Mock()
+        mock_response.iter_lines.return_value = [
+            json.dumps({"response": "Partial ", "done": False}).encode(),
+            json.dumps({"error": "out of memory"}).encode()
+        ]
+        mock_post.return_value = mock_response
+        with pytest.raises(Exception, match="out of memory"):
+            self.service.generate_sync("Test prompt")
+        
+        mock_response.iter_lines.return_value = [json.dumps({"response": "Truncated", "done": False}).encode()]
+        with pytest.raises(Exception, match="done"):
+            self.service.generate_sync("Other prompt")
+    
+    def test_session_reused_across_context_entries(self):
+        """Test that the async session outlives a context block and is released by aclose."""
+        async def run():
+            async with self.service:
+                first = self.service.session
+            async with self.service:
+                second = self.service.session
+            assert first is second
+            assert not first.closed
+            await self.service.aclose()
+            assert first.closed
+            assert self.service.session is None
+        
+        asyncio.run(run())
+    
+    def test_aclose_waits_for_active_requests(self):
+        """Test that aclose() inside a running request defers until the request exits."""
+        async def run():
+            async with self.service:
+                session = self.service.session
+                await self.service.aclose()
+                assert not session.closed
+            assert session.closed
+            assert self.service.session is None
+        
+        asyncio.run(run())
+    
+    def test_session_from_previous_loop_is_closed(self):
+        """Test that entering on a new event loop closes the session opened on the old one."""
+        async def enter():
+            async with self.service:
+                return self.service.session
+        
+        first = asyncio.run(enter())
+        second = asyncio.run(enter())
+        assert first is not second
+        assert first.closed
+        asyncio.run(self.service.aclose())
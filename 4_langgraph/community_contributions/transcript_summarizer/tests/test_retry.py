@@ -0,0 +1,66 @@
+import asyncio
+import pytest
+from src.services.retry import CircuitBreaker, CircuitOpenError, retry_async
+
+class TransientError(Exception):
+    pass
+
+class TestRetry:
+    """Test cases for retry with backoff and the circuit breaker."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.calls = 0
+
+    def make_call(self, failures: int):
+        """Build a call that raises TransientError `failures` times, then succeeds."""
+        async def call():
+            self.calls += 1
+            if self.calls <= failures:
+                raise TransientError("busy")
+            return "ok"
+        return call
+
+    @staticmethod
+    def is_transient(error: Exception) -> bool:
+        return isinstance(error, TransientError)
+
+    def test_retries_transient_errors(self):
+        """Test that transient failures are retried until a call succeeds."""
+        result = asyncio.run(retry_async(self.make_call(2), self.is_transient, max_retries=3, base_delay=0))
+
+        assert result == "ok"
+        assert self.calls == 3
+
+    def test_gives_up_after_max_retries(self):
+        """Test that the last error is raised once retries are exhausted."""
+        with pytest.raises(TransientError):
+            asyncio.run(retry_async(self.make_call(10), self.is_transient, max_retries=2, base_delay=0))
+
+        assert self.calls == 3
+
+    def test_non_retryable_error_raised_immediately(self):
+        """Test that errors that aren't transient are not retried."""
+        with pytest.raises(TransientError):
+            asyncio.run(retry_async(self.make_call(1), lambda e: False, max_retries=3, base_delay=0))
+
+        assert self.calls == 1
+
+    def test_breaker_fails_fast_when_open(self):
+        """Test that an open breaker rejects calls without reaching the backend."""
+        breaker = CircuitBreaker(failure_threshold=0.5, min_calls=2, cooldown_s=60)
+        with pytest.raises(TransientError):
+            asyncio.run(retry_async(self.make_call(10), self.is_transient, breaker, max_retries=1, base_delay=0))
+        calls_before = self.calls
+
+        with pytest.raises(CircuitOpenError):
+            asyncio.run(retry_async(self.make_call(0), self.is_transient, breaker, base_delay=0))
+        assert self.calls == calls_before
+
+    def test_breaker_closes_after_cooldown(self):
+        """Test that calls are let through again once the cooldown has passed."""
+        breaker = CircuitBreaker(failure_threshold=0.5, min_calls=2, cooldown_s=0)
+        breaker.record(False)
+        breaker.record(False)
+
+        assert breaker.allow() is True
@@ -0,0 +1,245 @@
+import asyncio
+import re
+import pytest
+from types import SimpleNamespace
+from typing import Callable, List, Optional
+from unittest.mock import patch
+
+from src.core.chunker import TextChunk
+from src.core.summarizer import TranscriptSummarizer, RunSettings
+from src.services.gemini_service import ASYNC_MAX_OUTPUT_TOKENS
+from src.utils.config import Config
+
+
+class FakeChunker:
+    """Chunker making one chunk per sentence, so tests don't need a tokenizer."""
+
+    def __init__(self, chunk_size: int = 2000, overlap_size: int = 200):
+        self.chunk_size = chunk_size
+        self.overlap_size = overlap_size
+
+    def chunk_by_sentences(self, text: str) -> List[TextChunk]:
+        sentences = [s for s in re.split(r"(?<=\.)\s+", text.strip()) if s]
+        return [TextChunk(content=s, start_index=0, end_index=len(s), token_count=len(s.split()), chunk_id=i)
+                for i, s in enumerate(sentences)]
+
+
+class FakeLLMService:
+    """LLM service answering every prompt with `respond(prompt)` and recording the calls."""
+
+    def __init__(self, respond: Callable[[str], str]):
+        self.respond = respond
+        self.calls: List[dict] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def generate_async(self, prompt: str, temperature: float = 0.3, max_output_tokens: Optional[int] = None):
+        self.calls.append({"prompt": prompt, "temperature": temperature, "max_output_tokens": max_output_tokens})
+        await asyncio.sleep(0)
+        return SimpleNamespace(content=self.respond(prompt))
+
+    async def generate_sync_in_executor(self, prompt: str, temperature: float = 0.3):
+        return await self.generate_async(prompt, temperature)
+
+    async def generate_stream_async(self, prompt: str, temperature: float = 0.3):
+        self.calls.append({"prompt": prompt, "temperature": temperature, "stream": True})
+        for word in self.respond(prompt).split(" "):
+            await asyncio.sleep(0)
+            yield word + " "
+
+
+def echo_chunk(prompt: str) -> str:
+    """Answer a chunk prompt with its segment, and a final-summary prompt with a fixed text."""
+    if "Transcript segment:" in prompt:
+        return "About " + prompt.split("Transcript segment:\n")[1].split("\n")[0]
+    return "Final summary"
+
+
+class TestSplitMarshaledResponse:
+    """Test cases for splitting a marshaled response into per-chunk summaries."""
+
+    def test_rows_in_order(self):
+        """Test that each row's text becomes that row's summary."""
+        response = "---ROW 1---\nFirst summary\n\n---ROW 2---\nSecond summary"
+
+        assert TranscriptSummarizer._split_marshaled_response(response, 2) == ["First summary", "Second summary"]
+
+    def test_preamble_is_ignored(self):
+        """Test that text before the first row marker is dropped."""
+        response = "Here are the summaries:\n---ROW 1---\nFirst\n---ROW 2---\nSecond"
+
+        assert TranscriptSummarizer._split_marshaled_response(response, 2) == ["First", "Second"]
+
+    def test_missing_row_is_rejected(self):
+        """Test that a response missing a row (e.g. truncated output) is not split."""
+        response = "---ROW 1---\nFirst\n---ROW 2---\nSecond"
+
+        assert TranscriptSummarizer._split_marshaled_response(response, 3) is None
+
+    def test_duplicated_row_is_rejected(self):
+        """Test that a repeated marker standing in for another row is not accepted."""
+        response = "---ROW 1---\nFirst\n---ROW 1---\nAgain\n---ROW 3---\nThird"
+
+        assert TranscriptSummarizer._split_marshaled_response(response, 3) is None
+
+    def test_empty_row_is_rejected(self):
+        """Test that a row without a summary is not accepted."""
+        response = "---ROW 1---\nFirst\n---ROW 2---\n\n---ROW 3---\nThird"
+
+        assert TranscriptSummarizer._split_marshaled_response(response, 3) is None
+
+
+class TestTranscriptSummarizer:
+    """Test cases for the summarization workflow with a fake LLM service."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.chunker_patch = patch("src.core.summarizer.TextChunker", FakeChunker)
+        self.chunker_patch.start()
+        self.config = Config(llm_provider="ollama", warm_up_llm=False, cache_enabled=False)
+        self.summarizer = TranscriptSummarizer(self.config)
+
+    def teardown_method(self):
+        """Tear down test fixtures."""
+        self.chunker_patch.stop()
+
+    def settings(self, service: FakeLLMService, **overrides) -> RunSettings:
+        """Build run settings around a fake service."""
+        values = dict(
+            temperature=0.3, chunk_size=2000, chunk_overlap=200, marshal_batch_size=1,
+            llm_provider="ollama", model_name="fake-model", llm_service=service,
+            chunker=FakeChunker(), concurrency=2
+        )
+        values.update(overrides)
+        return RunSettings(**values)
+
+    def test_marshaled_batch_gets_output_budget_per_row(self):
+        """Test that a marshaled request is allowed one chunk's output tokens per row."""
+        def respond(prompt: str) -> str:
+            rows = re.findall(r"^---ROW (\d+)---$", prompt, re.MULTILINE)
+            return "\n".join(f"---ROW {row}---\nSummary {row}" for row in rows)
+
+        service = FakeLLMService(respond)
+        chunks = FakeChunker().chunk_by_sentences("One.\n\nTwo.\n\nThree.")
+        settings = self.settings(service, llm_provider="gemini", marshal_batch_size=3)
+
+        summaries, _, prompts_sent = asyncio.run(self.summarizer._summarize_pending_chunks(chunks, [0, 1, 2], settings))
+
+        assert summaries == ["Summary 1", "Summary 2", "Summary 3"]
+        assert prompts_sent == 1
+        assert service.calls[0]["max_output_tokens"] == 3 * ASYNC_MAX_OUTPUT_TOKENS
+
+    def test_unsplittable_batch_falls_back_to_one_request_per_chunk(self):
+        """Test that chunks of a marshaled response without usable row markers are summarized one by one."""
+        def respond(prompt: str) -> str:
+            if "---ROW " in prompt:
+                # Truncated: the second row never arrives
+                return "---ROW 1---\nSummary of one"
+            return "Single: " + prompt.split("Transcript segment:\n")[1].split("\n")[0]
+
+        service = FakeLLMService(respond)
+        chunks = FakeChunker().chunk_by_sentences("One.\n\nTwo.")
+        settings = self.settings(service, llm_provider="gemini", marshal_batch_size=2)
+
+        summaries, _, prompts_sent = asyncio.run(self.summarizer._summarize_pending_chunks(chunks, [0, 1], settings))
+
+        assert summaries == ["Single: One.", "Single: Two."]
+        assert prompts_sent == 3
+        assert [call["max_output_tokens"] for call in service.calls] == [2 * ASYNC_MAX_OUTPUT_TOKENS, None, None]
+
+    def test_single_chunk_is_summarized_in_one_call(self):
+        """Test that a one-chunk transcript skips the final-summary pass."""
+        service = FakeLLMService(echo_chunk)
+        self.summarizer.llm_service = service
+
+        result = asyncio.run(self.summarizer.summarize_text("Only one sentence."))
+
+        assert result.error is None
+        assert result.summary == "About Only one sentence."
+        assert result.chunks_processed == 1
+        assert len(service.calls) == 1
+
+    def test_multiple_chunks_get_a_final_summary(self):
+        """Test that chunk summaries are combined by a final-summary request."""
+        service = FakeLLMService(echo_chunk)
+        self.summarizer.llm_service = service
+
+        result = asyncio.run(self.summarizer.summarize_text("First point. Second point. Third point."))
+
+        assert result.summary == "Final summary"
+        assert result.chunks_processed == 3
+        assert len(service.calls) == 4
+        final_prompt = service.calls[-1]["prompt"]
+        assert "About First point.\n\nAbout Second point.\n\nAbout Third point." in final_prompt
+
+    def test_repeated_chunks_are_summarized_once(self):
+        """Test that a chunk repeated in the transcript is sent once and its summary shared."""
+        service = FakeLLMService(echo_chunk)
+        self.summarizer.llm_service = service
+
+        result = asyncio.run(self.summarizer.summarize_text("Sponsor read. The topic. Sponsor read."))
+
+        chunk_prompts = [call["prompt"] for call in service.calls if "Transcript segment:" in call["prompt"]]
+        assert len(chunk_prompts) == 2
+        assert "About Sponsor read.\n\nAbout The topic.\n\nAbout Sponsor read." in service.calls[-1]["prompt"]
+        assert result.chunks_processed == 3
+
+    def test_identical_prompts_are_sent_once(self):
+        """Test that duplicate prompts in one batch share a single request."""
+        service = FakeLLMService(lambda prompt: prompt.upper())
+
+        results, cache_hits = asyncio.run(self.summarizer._process_chunks_async(["a", "b", "a"], self.settings(service)))
+
+        assert results == ["A", "B", "A"]
+        assert cache_hits == 0
+        assert sorted(call["prompt"] for call in service.calls) == ["a", "b"]
+
+    def test_stream_yields_final_summary_as_it_is_generated(self, tmp_path):
+        """Test that summarize_vtt_file_stream streams the final pass and then returns the result."""
+        vtt = tmp_path / "talk.vtt"
+        vtt.write_text(
+            "WEBVTT\n\n"
+            "00:00:00.000 --> 00:00:03.000\nFirst point.\n\n"
+            "00:00:03.000 --> 00:00:06.000\nSecond point.\n"
+        )
+        service = FakeLLMService(lambda prompt: echo_chunk(prompt) if "Transcript segment:" in prompt else "Streamed final summary")
+        self.summarizer.llm_service = service
+
+        async def collect():
+            return [update async for update in self.summarizer.summarize_vtt_file_stream(str(vtt))]
+
+        updates = asyncio.run(collect())
+
+        partials = [text for text, result in updates if result is None]
+        assert partials
+        assert all(later.startswith(earlier) for earlier, later in zip(partials, partials[1:]))
+        summary, result = updates[-1]
+        assert result is not None and result.error is None
+        assert summary == result.summary == "Streamed final summary"
+        assert service.calls[-1].get("stream") is True
+
+    def test_concurrent_runs_keep_their_own_settings(self):
+        """Test that overrides apply per run and leave the shared configuration untouched."""
+        service = FakeLLMService(echo_chunk)
+        self.summarizer.llm_service = service
+        chunker = self.summarizer.chunker
+        defaults = (self.config.temperature, self.config.chunk_size, self.config.chunk_overlap)
+
+        async def run_both():
+            return await asyncio.gather(
+                self.summarizer.summarize_text("Alpha one. Alpha two.", chunk_size=500, chunk_overlap=50, temperature=0.1),
+                self.summarizer.summarize_text("Beta one. Beta two.", chunk_size=900, chunk_overlap=90, temperature=0.9)
+            )
+
+        results = asyncio.run(run_both())
+
+        assert all(result.error is None for result in results)
+        for call in service.calls:
+            expected = 0.1 if "Alpha" in call["prompt"] else 0.9
+            assert call["temperature"] == expected
+        assert (self.config.temperature, self.config.chunk_size, self.config.chunk_overlap) == defaults
+        assert self.summarizer.chunker is chunker
@@ -29,7 +29,19 @@ Let's start with the basics of machine learning.
         assert segments[0].text == "Hello and welcome to our presentation."
         assert segments[0].start_time == "00:00:00.000"
         assert segments[0].end_time == "00:00:03.000"
-    
+
+    def test_parse_file(self):
+        """Test parsing a VTT file from disk, including one saved with a BOM."""
+        for encoding in ("utf-8", "utf-8-sig"):
+            with tempfile.NamedTemporaryFile("w", suffix=".vtt", encoding=encoding, delete=False) as f:
+                f.write(self.sample_vtt)
+            try:
+                segments = self.parser.parse_file(f.name)
+            finally:
+                os.unlink(f.name)
+
+            assert segments == self.parser.parse_content(self.sample_vtt)
+
     def test_get_full_transcript(self):
         """Test getting full transcript without timestamps."""
         self.parser.parse_content(self.sample_vtt)
@@ -38,6 +50,15 @@ Let's start with the basics of machine learning.
         expected = "Hello and welcome to our presentation. Today we'll discuss artificial intelligence. Let's start with the basics of machine learning."
         assert full_text == expected
     
+    def test_full_transcript_refreshed_after_reparse(self):
+        """Test that the cached transcript is rebuilt when new content is parsed."""
+        self.parser.parse_content(self.sample_vtt)
+        self.parser.get_full_transcript()
+        
+        self.parser.parse_content("WEBVTT\n\n00:00:00.000 --> 00:00:02.000\nSomething else.\n")
+        
+        assert self.parser.get_full_transcript() == "Something else."
+    
     def test_get_transcript_with_timestamps(self):
         """Test getting transcript with timestamp markers."""
         self.parser.parse_content(self.sample_vtt)
@@ -46,6 +67,14 @@ Let's start with the basics of machine learning.
         assert "[00:00:00.000 -> 00:00:03.000]" in timestamped
         assert "Hello and welcome to our presentation." in timestamped
     
+    def test_duration_seconds(self):
+        """Test duration calculation from precomputed segment times."""
+        segments = self.parser.parse_content(self.sample_vtt)
+        
+        assert segments[1].start_s == 3.0
+        assert segments[1].end_s == 7.0
+        assert self.parser.get_duration_seconds() == 12.0
+    
     def test_clean_text(self):
         """Test text cleaning functionality."""
         dirty_text = "<i>Hello</i>   world   <b>test</b>"
@@ -53,6 +82,12 @@ Let's start with the basics of machine learning.
         
         assert clean_text == "Hello world test"
     
+    def test_clean_texts_matches_clean_text(self):
+        """Test that bulk cleaning gives the same result as cleaning each caption."""
+        texts = ["<i>Hello</i>   world", "a < b", "  <b>multi\nline</b>  ", ""]
+        
+        assert self.parser._clean_texts(texts) == [self.parser._clean_text(t) for t in texts]
+    
     def test_empty_content(self):
         """Test handling of empty content."""
         segments = self.parser.parse_content("")